@@ -26,6 +26,7 @@ Version: 1.1.0 (2025-09-12)
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 import contextlib
 import platform
@@ -106,32 +107,33 @@ class _Attempt:
 
 def _merge_params(base_params: Optional[str], extra_params: Dict[str, Optional[str]]) -> str:
     """Ersetzt/ergänzt Query-Parameter (case-insensitive Keys)."""
+    # Diagnose ruft dies je Treiber/Toggle-Kombination mit identischer Basis auf
+    return _merge_params_cached(base_params or "", tuple(extra_params.items()))
+
+
+@lru_cache(maxsize=256)
+def _merge_params_cached(base_params: str,
+                         extra_items: Tuple[Tuple[str, Optional[str]], ...]) -> str:
     parts: List[Tuple[str, str]] = []
-    seen = set()
+    pos: Dict[str, int] = {}  # key.lower() -> Index in parts
 
     def _add(k: str, v: Optional[str]) -> None:
-        kl = k.lower()
-        if kl in seen:
-            for i, (ek, _) in enumerate(parts):
-                if ek.lower() == kl:
-                    parts[i] = (k, "" if v is None else str(v))
-                    return
+        val = "" if v is None else str(v)
+        i = pos.get(k.lower())
+        if i is None:
+            pos[k.lower()] = len(parts)
+            parts.append((k, val))
         else:
-            seen.add(kl)
-            parts.append((k, "" if v is None else str(v)))
-
-    if base_params:
-        for piece in base_params.split("&"):
-            piece = piece.strip()
-            if not piece:
-                continue
-            if "=" in piece:
-                k, v = piece.split("=", 1)
-            else:
-                k, v = piece, ""
-            _add(k, v)
-
-    for k, v in extra_params.items():
+            parts[i] = (k, val)
+
+    for piece in base_params.split("&"):
+        piece = piece.strip()
+        if not piece:
+            continue
+        k, _, v = piece.partition("=")
+        _add(k, v)
+
+    for k, v in extra_items:
         _add(k, v)
 
     return "&".join(f"{k}={v}" if v != "" else k for k, v in parts)
@@ -443,7 +445,7 @@ def diagnose_with_fallbacks(settings) -> Tuple[bool, Dict[str, Any]]:
         return True, {"summary": "Verbindung OK (pymssql)", "attempts": attempts, "suggestions": []}
 
     # Hinweise verdichten (18456 etc.)
-    if any("18456" in (str(a.get("error")) if a.get("error") else "") for a in attempts):
+    if any((err := a.get("error")) and "18456" in str(err) for a in attempts):
         suggestions += [
             "Fehler 18456 (Login failed): Login-Typ/Passwort/Default-DB prüfen; ggf. 'Trusted_Connection=yes' verwenden.",
         ]
@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
 # Writer-Subpackage
-from . import sql_writer as sql_writer
-__all__ = ["sql_writer"]
\ No newline at end of file
+try:  # benötigt pandas + SQLAlchemy (requirements-sql.txt)
+    from . import sql_writer as sql_writer
+except ImportError:  # pragma: no cover
+    sql_writer = None  # type: ignore
+from . import columnar_writer as columnar_writer  # pyarrow erst beim Schreiben nötig
+__all__ = ["sql_writer", "columnar_writer"]
\ No newline at end of file
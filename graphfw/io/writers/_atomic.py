@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+graphfw.io.writers._atomic — Atomares Schreiben von Exportdateien (intern)
+===============================================================================
+Zweck:
+    - Schreibt über eine temporäre Datei im *Zielverzeichnis*, synchronisiert
+      per fsync und ersetzt das Ziel anschließend per os.replace; danach wird
+      das Verzeichnis per fsync synchronisiert (POSIX), damit der Rename einen
+      Stromausfall übersteht.
+    - Ein Abbruch mitten im Schreiben hinterlässt keine halb geschriebene
+      Zieldatei; parallele Leser sehen entweder den alten oder den neuen Stand.
+
+Hinweise:
+    - Das Temp-File liegt im selben Verzeichnis wie das Ziel (gleiches
+      Dateisystem → os.replace ist atomar, auch unter Windows).
+    - Die Endung des Ziels wird übernommen, damit z. B. pandas die Excel-Engine
+      weiterhin aus der Dateiendung ableiten kann.
+    - mkstemp legt Dateien mit 0600 an; die Temp-Datei erhält daher die Rechte
+      eines bestehenden Ziels bzw. 0666 & ~umask (wie ein normales open()).
+
+Autor: graphfw
+Version: 1.0.0 (2025-09-12)
+===============================================================================
+"""
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+
+
+def _current_umask() -> int:
+    # umask lässt sich nur setzend lesen -> einmalig beim Import ermitteln
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_DEFAULT_MODE = 0o666 & ~_current_umask()
+
+
+def _target_mode(target: Path, new_mode: Optional[int] = None) -> int:
+    """Rechte für die neue Datei: die des bestehenden Ziels, sonst new_mode bzw. 0666 & ~umask."""
+    try:
+        return stat.S_IMODE(os.stat(target).st_mode)
+    except OSError:
+        return _DEFAULT_MODE if new_mode is None else new_mode
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Macht den Rename im Verzeichnis dauerhaft (POSIX); unter Windows nicht möglich."""
+    if os.name == "nt":
+        return
+    try:
+        dfd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dfd)
+    except OSError:
+        pass  # z. B. Dateisysteme ohne Verzeichnis-fsync
+    finally:
+        os.close(dfd)
+
+
+def _atomic_write(
+    target: Path, writer_fn: Callable[[Path], None], *, new_mode: Optional[int] = None
+) -> Path:
+    """
+    Ruft `writer_fn(tmp_path)` auf und ersetzt danach `target` atomar.
+    new_mode: Rechte, falls `target` noch nicht existiert (z. B. 0o600 für
+    Dateien mit Secrets); Default 0666 & ~umask.
+
+    Bei Fehlern wird die temporäre Datei entfernt und die Exception
+    weitergereicht; ein bestehendes `target` bleibt unverändert.
+    """
+    target = Path(target)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{target.stem}.", suffix=target.suffix, dir=str(target.parent)
+    )
+    # Handle sofort schließen: writer_fn öffnet den Pfad selbst
+    # (unter Windows ist ein doppelt geöffnetes File nicht beschreibbar).
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        os.chmod(tmp, _target_mode(target, new_mode))
+        writer_fn(tmp)
+        with open(tmp, "rb+") as f:
+            os.fsync(f.fileno())
+        # Path.replace (nicht rename): überschreibt auch unter Windows
+        tmp.replace(target)
+        _fsync_dir(target.parent)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    return target
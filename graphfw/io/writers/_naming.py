@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+graphfw.io.writers._naming — Gemeinsames Namensschema der Datei-Writer (intern)
+===============================================================================
+Zweck:
+    - Einheitlicher Dateiname: <prefix>[_<YYYYMMDD>_<hhmmss>][_<postfix>].<ext>
+    - Eindeutiger Suffix _001, _002, ... wenn die Zieldatei bereits existiert.
+    - Sanitizing von prefix/postfix wird gecacht (Batch-Exporte verwenden
+      typischerweise immer wieder dieselben Präfixe).
+    - Zielverzeichnis normalisieren (None -> CWD, relativ -> absolut).
+    - Optionaler Batch-Zeitstempel: begin_batch() friert den Zeitstempel ein,
+      sodass alle Dateien eines Laufs denselben <YYYYMMDD>_<hhmmss> tragen;
+      end_batch() kehrt zu datetime.now() je Datei zurück.
+
+Autor: graphfw
+Version: 1.0.0 (2025-09-12)
+===============================================================================
+"""
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+from graphfw.core.util import sanitize_for_filename
+
+
+_TS_FORMAT = "%Y%m%d_%H%M%S"
+
+# Eingefrorener Zeitstempel eines laufenden Batches (None -> je Aufruf now())
+_batch_timestamp: Optional[str] = None
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_cached(value: str) -> str:
+    return sanitize_for_filename(value)
+
+
+def begin_batch(ts: Optional[datetime] = None) -> str:
+    """
+    Startet einen Batch: alle folgenden Dateinamen mit Zeitstempel verwenden
+    denselben Wert (Default: jetzt). Gibt den Zeitstempel-String zurück.
+    """
+    global _batch_timestamp
+    _batch_timestamp = (ts or datetime.now()).strftime(_TS_FORMAT)
+    return _batch_timestamp
+
+
+def end_batch() -> None:
+    """Beendet den Batch; Zeitstempel werden wieder je Datei erzeugt."""
+    global _batch_timestamp
+    _batch_timestamp = None
+
+
+def _timestamp() -> str:
+    return _batch_timestamp or datetime.now().strftime(_TS_FORMAT)
+
+
+def _compose_filename(prefix: str, postfix: Optional[str], add_ts: bool, ext: str) -> str:
+    parts = [_sanitize_cached(prefix)]
+    if add_ts:
+        parts.append(_timestamp())
+    if postfix:
+        parts.append(_sanitize_cached(postfix))
+    # leere Bestandteile (z. B. komplett weg-sanitizter prefix) auslassen
+    stem = "_".join([p for p in parts if p])
+    return f"{stem}.{ext.lstrip('.')}"
+
+
+def _normalize_directory(directory: Optional[Union[str, Path]]) -> Path:
+    """
+    Normalisiert das Zielverzeichnis:
+    - None  -> CWD
+    - str/Path (relativ) -> relativ zu CWD
+    - Rückgabe ist stets ein *absoluter* Path (existiert u.U. noch nicht).
+    - Symlinks werden nicht aufgelöst (kein resolve()); wer einen kanonischen
+      Pfad benötigt, ruft selbst Path.resolve() auf.
+    """
+    if directory is None or (isinstance(directory, str) and not directory.strip()):
+        return Path.cwd()
+    base = Path(directory).expanduser()
+    if not base.is_absolute():
+        # rein stringbasiert (kein resolve(): keine stat-/Symlink-Auflösung)
+        base = Path(os.path.abspath(base))
+    return base
+
+
+def _next_free_path(path: Path, *, width: int = 3, default_suffix: str = "") -> Path:
+    """
+    Liefert einen eindeutigen Pfad, indem ein numerischer Suffix angehängt wird.
+    Beispiel: file.json -> file_001.json, file_002.json, ...
+
+    Statt je Kandidat exists() aufzurufen, wird das Verzeichnis einmal per
+    os.scandir gelesen und die kleinste freie Nummer im Speicher bestimmt
+    (ein Verzeichnis-Listing statt N stat-Aufrufen; v. a. auf Netzlaufwerken).
+    """
+    stem, suffix = path.stem, path.suffix or default_suffix
+    head = f"{stem}_"
+    used = set()
+    try:
+        with os.scandir(path.parent) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(head) and name.endswith(suffix):
+                    mid = name[len(head):len(name) - len(suffix)]
+                    if mid.isdigit():
+                        used.add(int(mid))
+    except FileNotFoundError:
+        pass  # Verzeichnis existiert (noch) nicht -> alles frei
+    i = 1
+    while i in used:
+        i += 1
+    return path.with_name(f"{stem}_{i:0{width}d}{suffix}")
@@ -8,6 +8,7 @@ Zweck:
     - Einheitliches Namensschema:
         <prefix>[_<YYYYMMDD>_<hhmmss>][_<postfix>].xlsx
     - Gibt den *vollständigen Pfad* der erzeugten Datei zurück.
+    - Atomarer Schreibvorgang (Temp-Datei im Zielordner + fsync + os.replace).
 
 Parameter (öffentlich):
     - prefix:      str        — erster Namensbestandteil (Dateinamen-sicher)
@@ -18,6 +19,7 @@ Parameter (öffentlich):
     - sheet_name:  str        — Blattname (Default: "Sheet1")
     - engine:      str|None   — pandas-Excel-Engine (z. B. "openpyxl" oder "xlsxwriter")
     - overwrite:   bool       — existierende Datei überschreiben (Default: False)
+    - cwd:         Path|None  — Basisordner statt Path.cwd() (für Batch-Exporte vorab ermittelt)
 
 Rückgabe:
     - write_excel(...): pathlib.Path
@@ -32,31 +34,11 @@ Version: 1.0.0 (2025-09-12)
 """
 from __future__ import annotations
 
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from graphfw.core.util import sanitize_for_filename
-
-
-def _compose_filename(prefix: str, postfix: Optional[str], add_ts: bool, ext: str) -> str:
-    parts = [sanitize_for_filename(prefix)]
-    if add_ts:
-        parts.append(datetime.now().strftime("%Y%m%d_%H%M%S"))
-    if postfix:
-        parts.append(sanitize_for_filename(postfix))
-    stem = "_".join([p for p in parts if p])
-    return f"{stem}.{ext.lstrip('.')}"
-
-
-def _next_free_path(path: Path, *, width: int = 3) -> Path:
-    stem, suffix = path.stem, path.suffix or ".xlsx"
-    i = 1
-    while True:
-        candidate = path.with_name(f"{stem}_{i:0{width}d}{suffix}")
-        if not candidate.exists():
-            return candidate
-        i += 1
+from graphfw.io.writers._atomic import _atomic_write
+from graphfw.io.writers._naming import _compose_filename, _next_free_path
 
 
 def build_excel_path(
@@ -64,6 +46,7 @@ def build_excel_path(
     prefix: str,
     postfix: Optional[str] = None,
     timestamp: bool = True,
+    cwd: Optional[Path] = None,
 ) -> Path:
     """
     Erzeugt den Zielpfad (im aktuellen Arbeitsverzeichnis) für die Excel-Datei.
@@ -72,9 +55,12 @@ def build_excel_path(
     -------
     Path
         Vollständiger Pfad (Datei wird nicht erstellt).
+
+    Hinweis: Für viele Exporte in Folge kann `cwd` einmalig ermittelt und
+    übergeben werden (spart den Path.cwd()-Aufruf pro Datei).
     """
     filename = _compose_filename(prefix, postfix, timestamp, "xlsx")
-    return Path.cwd() / filename
+    return (cwd if cwd is not None else Path.cwd()) / filename
 
 
 def write_excel(
@@ -88,6 +74,7 @@ def write_excel(
     sheet_name: str = "Sheet1",
     engine: Optional[str] = None,
     overwrite: bool = False,
+    cwd: Optional[Path] = None,
 ) -> Path:
     """
     Schreibt ein DataFrame als Excel (.xlsx) in das aktuelle Arbeitsverzeichnis (cwd).
@@ -97,25 +84,32 @@ def write_excel(
     Path
         Pfad der erzeugten Excel-Datei.
     """
-    target = build_excel_path(prefix=prefix, postfix=postfix, timestamp=timestamp)
+    target = build_excel_path(prefix=prefix, postfix=postfix, timestamp=timestamp, cwd=cwd)
     if target.exists() and not overwrite:
-        target = _next_free_path(target)
+        target = _next_free_path(target, default_suffix=".xlsx")
     target.parent.mkdir(parents=True, exist_ok=True)
 
     # Schreiben. Optionales Nummernformat für Datumsspalten wird (falls Engine unterstützt)
     # über einen ExcelWriter-Kontext gesetzt.
     # Hinweis: Für 'openpyxl' oder 'xlsxwriter' muss die jeweilige Engine installiert sein.
-    if date_format is None and engine is None:
+    # Geschrieben wird atomar über eine Temp-Datei im Zielordner (siehe _atomic_write).
+    # ExcelWriter-Kontext nur, wenn tatsächlich Zellformatierung gewünscht ist;
+    # eine explizite Engine allein reicht direkt an to_excel durch.
+    needs_writer = bool(date_format)
+    if not needs_writer:
         # Einfachster Weg: direkt to_excel
-        df.to_excel(target, index=index, sheet_name=sheet_name, engine=engine)
+        _atomic_write(
+            target,
+            lambda tmp: df.to_excel(tmp, index=index, sheet_name=sheet_name, engine=engine),
+        )
         return target
 
     # Feinsteuerung, z. B. Dateiformate
     import pandas as pd  # lokale Importierung, um harte Abhängigkeiten zu vermeiden
 
-    with pd.ExcelWriter(target, engine=engine) as writer:
-        df.to_excel(writer, index=index, sheet_name=sheet_name)
-        if date_format:
+    def _write_with_writer(tmp: Path) -> None:
+        with pd.ExcelWriter(tmp, engine=engine) as writer:
+            df.to_excel(writer, index=index, sheet_name=sheet_name)
             try:
                 wb = writer.book  # type: ignore[attr-defined]
                 ws = writer.sheets.get(sheet_name)  # type: ignore[attr-defined]
@@ -137,6 +131,7 @@ def write_excel(
                 # Best-effort: Wenn Formatierung nicht möglich ist, schreiben wir trotzdem die Datei.
                 pass
 
+    _atomic_write(target, _write_with_writer)
     return target
 
 
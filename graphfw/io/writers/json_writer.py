@@ -8,6 +8,7 @@ Zweck:
     - Einheitliches Namensschema:
         <prefix>[_<YYYYMMDD>_<hhmmss>][_<postfix>].json
     - Gibt den *vollständigen Pfad* der erzeugten Datei zurück.
+    - Atomarer Schreibvorgang (Temp-Datei im Zielordner + fsync + os.replace).
 
 Parameter (öffentlich):
     - prefix:      str        — erster Namensbestandteil (Dateinamen-sicher)
@@ -20,6 +21,7 @@ Parameter (öffentlich):
     - indent:      int|None   — JSON-Pretty-Print (Default: 2)
     - force_ascii: bool       — Nicht-ASCII mit \\u-Escapes (Default: False)
     - overwrite:   bool       — existierende Datei überschreiben (Default: False)
+    - cwd:         Path|None  — Basisordner statt Path.cwd() (für Batch-Exporte vorab ermittelt)
 
 Rückgabe:
     - write_json(...): pathlib.Path
@@ -33,31 +35,11 @@ Version: 1.0.0 (2025-09-12)
 """
 from __future__ import annotations
 
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from graphfw.core.util import sanitize_for_filename
-
-
-def _compose_filename(prefix: str, postfix: Optional[str], add_ts: bool, ext: str) -> str:
-    parts = [sanitize_for_filename(prefix)]
-    if add_ts:
-        parts.append(datetime.now().strftime("%Y%m%d_%H%M%S"))
-    if postfix:
-        parts.append(sanitize_for_filename(postfix))
-    stem = "_".join([p for p in parts if p])
-    return f"{stem}.{ext.lstrip('.')}"
-
-
-def _next_free_path(path: Path, *, width: int = 3) -> Path:
-    stem, suffix = path.stem, path.suffix or ".json"
-    i = 1
-    while True:
-        candidate = path.with_name(f"{stem}_{i:0{width}d}{suffix}")
-        if not candidate.exists():
-            return candidate
-        i += 1
+from graphfw.io.writers._atomic import _atomic_write
+from graphfw.io.writers._naming import _compose_filename, _next_free_path
 
 
 def build_json_path(
@@ -65,6 +47,7 @@ def build_json_path(
     prefix: str,
     postfix: Optional[str] = None,
     timestamp: bool = True,
+    cwd: Optional[Path] = None,
 ) -> Path:
     """
     Erzeugt den Zielpfad (im aktuellen Arbeitsverzeichnis) für die JSON-Datei.
@@ -73,9 +56,12 @@ def build_json_path(
     -------
     Path
         Vollständiger Pfad (Datei wird nicht erstellt).
+
+    Hinweis: Für viele Exporte in Folge kann `cwd` einmalig ermittelt und
+    übergeben werden (spart den Path.cwd()-Aufruf pro Datei).
     """
     filename = _compose_filename(prefix, postfix, timestamp, "json")
-    return Path.cwd() / filename
+    return (cwd if cwd is not None else Path.cwd()) / filename
 
 
 def write_json(
@@ -91,6 +77,7 @@ def write_json(
     indent: Optional[int] = 2,
     force_ascii: bool = False,
     overwrite: bool = False,
+    cwd: Optional[Path] = None,
 ) -> Path:
     """
     Schreibt ein DataFrame als JSON in das aktuelle Arbeitsverzeichnis (cwd).
@@ -100,22 +87,24 @@ def write_json(
     Path
         Pfad der erzeugten JSON-Datei.
     """
-    target = build_json_path(prefix=prefix, postfix=postfix, timestamp=timestamp)
+    target = build_json_path(prefix=prefix, postfix=postfix, timestamp=timestamp, cwd=cwd)
     if target.exists() and not overwrite:
-        target = _next_free_path(target)
+        target = _next_free_path(target, default_suffix=".json")
     target.parent.mkdir(parents=True, exist_ok=True)
 
     # Wenn Index gefordert ist, in Daten kopieren (to_json kennt 'index' nicht für alle Orients)
     df_to_write = df if index is False else df.reset_index()
 
     # pandas -> DataFrame.to_json unterstützt Pfad + Encoding ab neueren Versionen via open()
+    # Ein Durchlauf in pandas (inkl. Einrückung); kein Re-Parse der Ausgabe
     text = df_to_write.to_json(
         orient=orient,
         date_format=date_format,
         force_ascii=force_ascii,
         indent=indent,
     )
-    target.write_text(text, encoding=encoding)
+    # Atomar schreiben: Temp-Datei im Zielordner + fsync + os.replace
+    _atomic_write(target, lambda tmp: tmp.write_text(text, encoding=encoding))
     return target
 
 
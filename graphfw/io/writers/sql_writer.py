@@ -10,14 +10,16 @@ Robuster DataFrame->SQL-Writer (SQLAlchemy + pyodbc) mit:
 - Optionaler Schema-Evolution: fehlende Spalten werden per ALTER TABLE ergänzt
 - Optionales Recreate: DROP TABLE + Neuaufbau aus DataFrame
 - Optionales Spaltentyp-Alignment (String-Längen an DF anpassen)
-- Optionaler Stored-Procedure-Call nach dem Insert
+- Optionaler Stored-Procedure-Call nach dem Insert (optional asynchron)
 - Deterministischem Verhalten & aussagekräftigem `info`-Dict
 
 Neu:
 - `recreate: bool` — droppt Tabelle (falls vorhanden) und legt sie neu an.
 - `align_columns: bool` (Alias: `alignColumn`, `alighnColumn`) — passt
   (N)VARCHAR-Längen nach oben an, falls DF-Strings länger sind als die
-  aktuelle Spaltenlänge. Bei Bedarf bis NVARCHAR(MAX).
+  aktuelle Spaltenlänge (auf Zweierpotenzen gerundet). Bei Bedarf bis NVARCHAR(MAX).
+- `fast_insert: bool` — Insert per `cursor.executemany` (pyodbc
+  `fast_executemany`); NaN/NaT werden vektorisiert zu NULL.
 
 Hinweise
 --------
@@ -49,13 +51,18 @@ ok, info = write_sql(
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple, Iterable, Set, List
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Iterable, List
 
 import re
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
-from sqlalchemy import MetaData, Table, Column, text, inspect
+from sqlalchemy import MetaData, Table, Column, text, inspect, bindparam
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import NoSuchTableError
 from sqlalchemy.types import String, Integer, Float, DateTime, Boolean
 from sqlalchemy import create_engine
 from urllib.parse import quote_plus
@@ -111,6 +118,7 @@ def build_engine(cfg: Dict[str, Any], db_name: str,
 _VALID_IDENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 
+@lru_cache(maxsize=4096)
 def _is_valid_identifier(name: str) -> bool:
     return bool(_VALID_IDENT.match(name or ""))
 
@@ -174,16 +182,43 @@ def _ensure_schema(engine: Engine, schema: str, info: Dict[str, Any]) -> None:
     info["schema_created"] = info.get("schema_created") or False
 
 
-def _table_exists(engine: Engine, schema: str, table: str) -> bool:
-    insp = inspect(engine)
-    return insp.has_table(table_name=table, schema=schema)
+# Reflektierte Spaltennamen je Engine und (schema, table) wiederverwenden
+# (inspect() initialisiert die Dialekt-Reflection bei jedem Aufruf neu).
+# Schwache Engine-Schlüssel: die Werte halten keine Engine, der Cache hält
+# Engines/Pools also nicht am Leben. Inspector-Objekte werden nicht geteilt
+# (nicht thread-sicher); write_sql invalidiert nach eigener DDL.
+_COLUMNS_CACHE: "weakref.WeakKeyDictionary[Engine, Dict[Tuple[str, str], Optional[FrozenSet[str]]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_COLUMNS_CACHE_LOCK = threading.Lock()
+
+
+def _forget_columns(engine: Engine, schema: str, table: str) -> None:
+    """Cache-Eintrag nach DDL (CREATE/DROP/ALTER) verwerfen."""
+    with _COLUMNS_CACHE_LOCK:
+        per_engine = _COLUMNS_CACHE.get(engine)
+        if per_engine is not None:
+            per_engine.pop((schema, table), None)
 
 
-def _existing_columns(engine: Engine, schema: str, table: str) -> Set[str]:
-    insp = inspect(engine)
-    cols = set()
-    for col in insp.get_columns(table, schema=schema) or []:
-        cols.add(str(col.get("name")))
+def _reflect_columns(engine: Engine, schema: str, table: str) -> Optional[FrozenSet[str]]:
+    """
+    Ein Reflection-Roundtrip für Existenz + Spalten (je Engine/Tabelle gecacht).
+    Rückgabe: Spaltennamen oder None, wenn die Tabelle nicht existiert.
+    """
+    key = (schema, table)
+    with _COLUMNS_CACHE_LOCK:
+        per_engine = _COLUMNS_CACHE.get(engine)
+        if per_engine is not None and key in per_engine:
+            return per_engine[key]
+    try:
+        cols: Optional[FrozenSet[str]] = frozenset(
+            str(col.get("name")) for col in inspect(engine).get_columns(table, schema=schema) or []
+        )
+    except NoSuchTableError:
+        cols = None
+    with _COLUMNS_CACHE_LOCK:
+        _COLUMNS_CACHE.setdefault(engine, {})[key] = cols
     return cols
 
 
@@ -192,6 +227,7 @@ def _create_table(engine: Engine, schema: str, table: str, df: pd.DataFrame) ->
     cols = [Column(str(c), _sqlalchemy_type_from_dtype(t)) for c, t in zip(df.columns, df.dtypes)]
     Table(table, metadata, *cols, extend_existing=True)
     metadata.create_all(engine)
+    _forget_columns(engine, schema, table)
 
 
 def _drop_table_if_exists(engine: Engine, schema: str, table: str) -> None:
@@ -205,6 +241,7 @@ def _drop_table_if_exists(engine: Engine, schema: str, table: str) -> None:
     )
     with engine.begin() as conn:
         conn.execute(stmt)
+    _forget_columns(engine, schema, table)
 
 
 def _add_missing_columns(engine: Engine, schema: str, table: str,
@@ -225,17 +262,20 @@ def _add_missing_columns(engine: Engine, schema: str, table: str,
             stmt = f"ALTER TABLE {schema_q}.{table_q} ADD {col_q} {tsql_type} NULL"
             conn.execute(text(stmt))
             added.append({"column": col_name, "type": tsql_type})
+    _forget_columns(engine, schema, table)
     if added:
         info["columns_added"] = info.get("columns_added", []) + added
 
 
-def _get_column_metadata(engine: Engine, schema: str, table: str) -> Dict[str, Dict[str, Any]]:
+def _get_column_metadata(engine: Engine, schema: str, table: str,
+                         columns: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
     """
     Liefert Metadaten je Spalte:
       { colname: {"data_type": "nvarchar", "max_len": 100, "is_nullable": True} }
     CHARACTER_MAXIMUM_LENGTH: -1 bedeutet NVARCHAR(MAX)/VARCHAR(MAX).
+    columns: optional auf diese Spaltennamen einschränken (AND COLUMN_NAME IN (...)).
     """
-    q = text("""
+    sql = """
         SELECT
             c.COLUMN_NAME,
             c.DATA_TYPE,
@@ -243,10 +283,17 @@ def _get_column_metadata(engine: Engine, schema: str, table: str) -> Dict[str, D
             c.IS_NULLABLE
         FROM INFORMATION_SCHEMA.COLUMNS c
         WHERE c.TABLE_SCHEMA = :schema AND c.TABLE_NAME = :table
-    """)
+    """
+    params: Dict[str, Any] = {"schema": schema, "table": table}
+    if columns is not None:
+        sql += " AND c.COLUMN_NAME IN :cols"
+        params["cols"] = [str(c) for c in columns]
+    q = text(sql)
+    if columns is not None:
+        q = q.bindparams(bindparam("cols", expanding=True))
     meta: Dict[str, Dict[str, Any]] = {}
     with engine.connect() as conn:
-        rows = conn.execute(q, {"schema": schema, "table": table}).mappings().all()
+        rows = conn.execute(q, params).mappings().all()
         for r in rows:
             meta[str(r["COLUMN_NAME"])] = {
                 "data_type": str(r["DATA_TYPE"]).lower(),
@@ -256,6 +303,12 @@ def _get_column_metadata(engine: Engine, schema: str, table: str) -> Dict[str, D
     return meta
 
 
+def _is_string_like_dtype(dtype: Any) -> bool:
+    """object-, 'str'- (pandas >= 3) oder 'string[...]'-Spalten."""
+    s = str(dtype)
+    return s == "object" or s == "str" or s.startswith("string")
+
+
 def _compute_needed_string_length(series: pd.Series) -> int:
     """
     Berechnet die benötigte Zeichenlänge für Strings einer DF-Spalte.
@@ -270,6 +323,14 @@ def _compute_needed_string_length(series: pd.Series) -> int:
     return int(s.map(len).max())
 
 
+def _next_bucket(n: int) -> int:
+    """
+    Rundet eine benötigte Länge auf die nächste Zweierpotenz (min. 16, max. 4000).
+    Beispiele: 50 -> 64, 200 -> 256, 1000 -> 1024, 3000 -> 4000.
+    """
+    return min(4000, max(16, 1 << (max(n, 1) - 1).bit_length()))
+
+
 def _alter_varchar_length(engine: Engine, schema: str, table: str,
                           col: str, target_len: Optional[int],
                           prefer_nvarchar: bool, keep_nullability: bool,
@@ -292,6 +353,7 @@ def _alter_varchar_length(engine: Engine, schema: str, table: str,
     stmt = f"ALTER TABLE {schema_q}.{table_q} ALTER COLUMN {col_q} {type_sql} {null_sql}"
     with engine.begin() as conn:
         conn.execute(text(stmt))
+    _forget_columns(engine, schema, table)
 
     info.setdefault("columns_altered", []).append({
         "column": col,
@@ -300,6 +362,94 @@ def _alter_varchar_length(engine: Engine, schema: str, table: str,
     })
 
 
+# ----------------------------- Fast-Insert -----------------------------------
+
+def _rows_for_executemany(df: pd.DataFrame) -> List[List[Any]]:
+    """
+    Baut die Parameterliste für `cursor.executemany` (NaN/NaT/None -> None).
+    Vektorisiert: genau ein Objekt-Array (NA bereits als None), danach eine
+    einzige C-seitige `.tolist()`-Konvertierung – keine Python-Schleife über
+    Zeilen oder Zellen.
+    """
+    return df.to_numpy(dtype=object, na_value=None).tolist()
+
+
+# Statische SQL-Strings je Ziel cachen (Batch-Pipelines schreiben dieselbe Tabelle
+# wiederholt): Key = (schema, table, Spaltentupel).
+_INSERT_SQL_CACHE: Dict[Tuple[str, str, Tuple[str, ...]], str] = {}
+
+
+def _insert_sql(schema: str, table: str, cols: Tuple[str, ...]) -> str:
+    key = (schema, table, cols)
+    stmt = _INSERT_SQL_CACHE.get(key)
+    if stmt is None:
+        for c in cols:
+            if not _is_valid_identifier(c):
+                raise ValueError(f"Invalid column name: {c!r}")
+        col_sql = ",".join(_quote_ident(c) for c in cols)
+        placeholders = ",".join("?" * len(cols))
+        stmt = (f"INSERT INTO {_quote_ident(schema)}.{_quote_ident(table)} "
+                f"({col_sql}) VALUES ({placeholders})")
+        _INSERT_SQL_CACHE[key] = stmt
+    return stmt
+
+
+@lru_cache(maxsize=256)
+def _truncate_sql(schema: str, table: str) -> str:
+    return f"TRUNCATE TABLE {_quote_ident(schema)}.{_quote_ident(table)}"
+
+
+@lru_cache(maxsize=256)
+def _exec_sql(stored_procedure: str) -> str:
+    return f"EXEC {stored_procedure}"
+
+
+def _fast_insert(engine: Engine, schema: str, table: str, df: pd.DataFrame,
+                 chunksize: Optional[int] = None) -> str:
+    """
+    Insert über die rohe DBAPI-Verbindung (pyodbc `fast_executemany`).
+    Gibt das ausgeführte INSERT-Statement zurück.
+    """
+    stmt = _insert_sql(schema, table, tuple(str(c) for c in df.columns))
+
+    rows = _rows_for_executemany(df)
+    step = chunksize or len(rows) or 1
+    raw = engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        if hasattr(cur, "fast_executemany"):
+            cur.fast_executemany = True
+        for i in range(0, len(rows), step):
+            cur.executemany(stmt, rows[i:i + step])
+        raw.commit()
+    finally:
+        raw.close()
+    return stmt
+
+
+# ----------------------------- Stored Procedure ------------------------------
+
+_SPROC_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SPROC_EXECUTOR_LOCK = threading.Lock()
+
+
+def _sproc_executor() -> ThreadPoolExecutor:
+    """Ein gemeinsamer Hintergrund-Thread für asynchrone Stored-Procedure-Aufrufe."""
+    global _SPROC_EXECUTOR
+    with _SPROC_EXECUTOR_LOCK:
+        if _SPROC_EXECUTOR is None:
+            _SPROC_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graphfw-sproc")
+        return _SPROC_EXECUTOR
+
+
+def _exec_stored_procedure(engine: Engine, stored_procedure: str) -> float:
+    """Führt `EXEC <sp>` in eigener Transaktion aus; Rückgabe: Laufzeit in Sekunden."""
+    t_sp = time.time()
+    with engine.begin() as conn:
+        conn.execute(text(_exec_sql(stored_procedure)))
+    return round(time.time() - t_sp, 3)
+
+
 # ----------------------------- Hauptfunktion ---------------------------------
 
 def write_sql(df: pd.DataFrame, *,
@@ -312,6 +462,8 @@ def write_sql(df: pd.DataFrame, *,
               evolve_on_new_columns: bool = False,
               recreate: bool = False,
               align_columns: bool = False,
+              fast_insert: bool = False,
+              async_sproc: bool = False,
               **kwargs) -> Tuple[bool, Dict[str, Any]]:
     """
     Schreibt einen DataFrame in eine SQL-Tabelle.
@@ -341,6 +493,18 @@ def write_sql(df: pd.DataFrame, *,
     align_columns : bool, default False
         Passt (N)VARCHAR-Längen nach oben an, wenn DF-Strings länger sind.
         Hinweis: Es werden **keine** numerischen/zeitlichen Typ-Änderungen vorgenommen.
+    fast_insert : bool, default False
+        Insert direkt per `cursor.executemany` (pyodbc `fast_executemany`) statt
+        `DataFrame.to_sql`. Spaltennamen müssen gültige Identifier sein.
+    async_sproc : bool, default False
+        Stored Procedure nach dem (committeten) Insert im Hintergrund ausführen.
+        `info["stored_procedure_future"]` enthält dann ein `concurrent.futures.Future`,
+        dessen Ergebnis die Laufzeit in Sekunden ist (Fehler werden beim
+        `.result()` geworfen).
+
+    Batch-Writes über mehrere Tabellen lassen sich mit
+    `ThreadPoolExecutor(max_workers=N).map(...)` parallelisieren (I/O-gebunden;
+    die Engine nutzt einen Connection-Pool mit pre_ping).
 
     Zusätzliche Kompatibilitäts-Aliase (kwargs)
     -------------------------------------------
@@ -376,6 +540,8 @@ def write_sql(df: pd.DataFrame, *,
         "recreate": bool(recreate),
         "align_columns": bool(align_columns),
         "evolve_on_new_columns": bool(evolve_on_new_columns),
+        "fast_insert": bool(fast_insert),
+        "async_sproc": bool(async_sproc),
     }
 
     # Validierung von Schema/Tabellenname
@@ -395,7 +561,8 @@ def write_sql(df: pd.DataFrame, *,
 
     # 2) Recreate-Logik oder Ensure-Table
     t_table = time.time()
-    existed_before = _table_exists(engine, schema, table)
+    existing_cols = _reflect_columns(engine, schema, table)
+    existed_before = existing_cols is not None
     if recreate and existed_before:
         _drop_table_if_exists(engine, schema, table)
         existed_before = False  # fällt durch zur Neuerstellung
@@ -409,7 +576,7 @@ def write_sql(df: pd.DataFrame, *,
     # 3) Schema-Evolution (fehlende Spalten ergänzen), nur wenn nicht gerade neu erstellt
     if existed_before and evolve_on_new_columns and not recreate:
         t_evo = time.time()
-        existing = _existing_columns(engine, schema, table)
+        existing = existing_cols or set()
         missing = [(c, t) for c, t in zip(df.columns, df.dtypes) if str(c) not in existing]
         _add_missing_columns(engine, schema, table, missing, info)
         info["timings"]["evolve_columns_s"] = round(time.time() - t_evo, 3)
@@ -417,10 +584,12 @@ def write_sql(df: pd.DataFrame, *,
     # 4) Optional: Spaltentyp-Alignment (Strings)
     if (existed_before or not recreate) and align_columns:
         t_align = time.time()
-        meta = _get_column_metadata(engine, schema, table)
+        # Ohne String-Spalten im DF gibt es nichts auszurichten -> kein Metadaten-Roundtrip
+        string_cols = [c for c, d in zip(df.columns, df.dtypes) if _is_string_like_dtype(d)]
+        meta = _get_column_metadata(engine, schema, table, string_cols) if string_cols else {}
         # Iteriere über DF-Spalten mit String-Inhalt
         alterations: List[Tuple[str, Optional[int], bool, bool]] = []  # (col, new_len|None, prefer_nvarchar, current_nullable)
-        for col_name in df.columns:
+        for col_name in string_cols:
             if not _is_valid_identifier(str(col_name)):
                 info["warnings"].append(f"Skipping alignment for invalid column name: {col_name!r}")
                 continue
@@ -446,11 +615,12 @@ def write_sql(df: pd.DataFrame, *,
             if needed <= cur_len:
                 continue  # passt bereits
 
-            # Ziel-Länge bestimmen: bis 4000 -> NVARCHAR(n), darüber -> NVARCHAR(MAX)
+            # Ziel-Länge bestimmen: bis 4000 -> NVARCHAR(n) auf Zweierpotenz gerundet
+            # (weniger Folge-ALTERs bei wachsenden Daten), darüber -> NVARCHAR(MAX)
             if needed > 4000:
                 new_len = None  # -> MAX
             else:
-                new_len = needed
+                new_len = _next_bucket(needed)
 
             # Bevorzugt ursprünglichen Typ (varchar vs nvarchar) beibehalten
             prefer_nvarchar = (dt == "nvarchar")
@@ -472,7 +642,7 @@ def write_sql(df: pd.DataFrame, *,
         # 5) TRUNCATE (optional) – überspringen, wenn gerade recreate (Tabelle ist leer)
         if truncate and not (recreate and info["table_created"]):
             t_tr = time.time()
-            stmt = f"TRUNCATE TABLE {_quote_ident(schema)}.{_quote_ident(table)}"
+            stmt = _truncate_sql(schema, table)
             info["sql"].append(stmt)
             with engine.begin() as conn:
                 conn.execute(text(stmt))
@@ -480,22 +650,29 @@ def write_sql(df: pd.DataFrame, *,
 
         # 6) Insert
         t_ins = time.time()
-        df.to_sql(table, engine, schema=schema, if_exists="append", index=False, chunksize=chunksize)
+        if fast_insert:
+            info["sql"].append(_fast_insert(engine, schema, table, df, chunksize))
+        else:
+            df.to_sql(table, engine, schema=schema, if_exists="append", index=False, chunksize=chunksize)
         info["rowcount"] = int(len(df))
         info["timings"]["insert_s"] = round(time.time() - t_ins, 3)
 
-        # 7) Optional: Stored Procedure
+        # 7) Optional: Stored Procedure (synchron oder im Hintergrund)
         if stored_procedure:
-            t_sp = time.time()
-            info["sql"].append(f"EXEC {stored_procedure}")
-            with engine.begin() as conn:
-                conn.execute(text(f"EXEC {stored_procedure}"))
-            info["timings"]["stored_procedure_s"] = round(time.time() - t_sp, 3)
+            info["sql"].append(_exec_sql(stored_procedure))
+            if async_sproc:
+                info["stored_procedure_future"] = _sproc_executor().submit(
+                    _exec_stored_procedure, engine, stored_procedure
+                )
+            else:
+                info["timings"]["stored_procedure_s"] = _exec_stored_procedure(engine, stored_procedure)
 
         info["timings"]["total_s"] = round(time.time() - start, 3)
         return True, info
 
     except Exception as ex:
+        # Tabelle evtl. extern verändert -> beim nächsten Aufruf neu reflektieren
+        _forget_columns(engine, schema, table)
         info["error"] = f"{type(ex).__name__}: {ex}"
         info["timings"]["total_s"] = round(time.time() - start, 3)
         return False, info
@@ -15,14 +15,16 @@ Wichtig:
       pandas.to_xml übergeben (Workaround für Fehlermeldung
       "unexpected keyword argument 'date_format'").
     - Falls `DataFrame.to_xml` nicht verfügbar ist (pandas < 1.3), greift
-      ein Fallback auf xml.etree.ElementTree.
+      ein Fallback auf lxml.etree (falls installiert) bzw. xml.etree.ElementTree.
 
 Öffentliche API:
     - build_xml_path(...)
     - write_xml(...)
+    - begin_batch(ts=None) / end_batch() — gemeinsamer Zeitstempel für alle
+      Dateien eines Batch-Laufs (siehe graphfw.io.writers._naming)
 
 Parameter (write_xml):
-    - df:              pandas-kompatibles DataFrame (muss .to_dict('records') o.ä. unterstützen)
+    - df:              pandas-kompatibles DataFrame (oder Iterable[Mapping] im Fallback)
     - prefix:          str        — erster Namensbestandteil (Dateinamen-sicher)
     - postfix:         str|None   — optionaler letzter Bestandteil (Dateinamen-sicher)
     - timestamp:       bool       — ob Datum/Uhrzeit zwischen prefix und postfix steht
@@ -35,14 +37,20 @@ Parameter (write_xml):
     - root_name:       str        — Wurzel-Element (Default: "data")
     - row_name:        str        — Zeilen-Element (Default: "row")
     - xml_declaration: bool       — XML-Deklaration schreiben (Default: True)
-    - pretty_print:    bool       — Einrückungen/Zeilenumbrüche (Default: True)
+    - pretty_print:    bool|None  — Einrückungen/Zeilenumbrüche (Default: None → automatisch:
+                         an bis _PRETTY_PRINT_MAX_ROWS (10_000) Zeilen, darüber kompakt;
+                         True/False erzwingt die jeweilige Ausgabe)
     - overwrite:       bool       — existierende Datei überschreiben (Default: False)
+    - return_info:     bool       — zusätzlich ein Info-Dict zurückgeben (Default: False)
 
 Rückgabe:
     - write_xml(...): pathlib.Path (absoluter Pfad)
+    - write_xml(..., return_info=True): (pathlib.Path, info) — info enthält u. a.
+      das tatsächlich verwendete pretty_print und ggf. einen Hinweis in "notes",
+      wenn es wegen der Zeilenzahl automatisch abgeschaltet wurde.
 
 Abhängigkeiten:
-    * Standardbibliothek; optional pandas (falls vorhanden).
+    * Standardbibliothek; optional pandas und lxml (falls vorhanden).
 
 Autor: graphfw
 Version: 1.3.0 (2025-09-12)
@@ -50,52 +58,58 @@ Version: 1.3.0 (2025-09-12)
 """
 from __future__ import annotations
 
-from datetime import datetime
+import inspect
+import io
+import os
+import re
+import sys
 from pathlib import Path
-from typing import Any, Iterable, Optional, Union
+from typing import Any, BinaryIO, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
-from graphfw.core.util import sanitize_for_filename
+from graphfw.io.writers._naming import (
+    _compose_filename,
+    _next_free_path,
+    _normalize_directory,
+    begin_batch,
+    end_batch,
+)
 
+# Unterstützte to_xml-Parameter je DataFrame-Typ (pandas-Version ist zur Laufzeit fix)
+_ALLOWED_CACHE: Dict[type, FrozenSet[str]] = {}
 
-def _compose_filename(prefix: str, postfix: Optional[str], add_ts: bool, ext: str) -> str:
-    parts = [sanitize_for_filename(prefix)]
-    if add_ts:
-        parts.append(datetime.now().strftime("%Y%m%d_%H%M%S"))
-    if postfix:
-        parts.append(sanitize_for_filename(postfix))
-    stem = "_".join([p for p in parts if p])
-    return f"{stem}.{ext.lstrip('.')}"
+# Stichprobengröße für die Datums-Erkennung in Objekt-Spalten
+_DATE_SNIFF_SAMPLE = 32
 
+# Zeichen, die im Textinhalt escaped werden müssen (Fallback-Writer ohne lxml)
+_NEEDS_ESCAPE = re.compile(r"[<>&]")
 
-def _next_free_path(path: Path, *, width: int = 3) -> Path:
-    stem, suffix = path.stem, path.suffix or ".xml"
-    i = 1
-    while True:
-        candidate = path.with_name(f"{stem}_{i:0{width}d}{suffix}")
-        if not candidate.exists():
-            return candidate
-        i += 1
+# Ab dieser Zeilenzahl wird bei pretty_print=None (Default) kompakt geschrieben
+# (Einrückungen kosten Serialisierungszeit und blähen große Dateien auf)
+_PRETTY_PRINT_MAX_ROWS = 10_000
+
+# Schreibpuffer für Ausgabedateien (1 MiB statt Default 8 KiB -> weniger write()-Syscalls)
+_WRITE_BUFFER = 1 << 20
 
 
-def _normalize_directory(directory: Optional[Union[str, Path]]) -> Path:
+def _open_target(target: Path, overwrite: bool) -> Tuple[Path, BinaryIO]:
     """
-    Normalisiert das Zielverzeichnis:
-    - None  -> CWD
-    - str/Path (relativ) -> relativ zu CWD
-    - Rückgabe ist stets ein *absoluter* Path (existiert u.U. noch nicht).
+    Öffnet die Zieldatei gepuffert zum Schreiben.
+    overwrite=False: optimistisch per O_CREAT|O_EXCL anlegen (ein Syscall, kein
+    exists()-Check, kein TOCTOU-Fenster); nur bei Kollision wird der nächste freie
+    Suffix gesucht.
     """
-    if directory is None or (isinstance(directory, str) and not directory.strip()):
-        base = Path.cwd()
-    else:
-        base = Path(directory)
-        if not base.is_absolute():
-            base = Path.cwd() / base
-    # resolve ohne strict, damit Pfad auch ohne Existenz absolut wird
-    try:
-        base = base.expanduser().resolve(strict=False)
-    except Exception:
-        base = base.expanduser()
-    return base
+    if overwrite:
+        return target, open(target, "wb", buffering=_WRITE_BUFFER)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    candidate = target
+    while True:
+        try:
+            fd = os.open(str(candidate), flags, 0o644)
+        except FileExistsError:
+            # Suffix immer vom ursprünglichen Namen aus bestimmen (file_001, nicht file_001_001)
+            candidate = _next_free_path(target, default_suffix=".xml")
+            continue
+        return candidate, os.fdopen(fd, "wb", buffering=_WRITE_BUFFER)
 
 
 def build_xml_path(
@@ -132,12 +146,24 @@ def build_xml_path(
 
 def _apply_date_format_if_requested(df: Any, fmt: Optional[str]) -> Any:
     """
-    Gibt eine Kopie des DF zurück, in der Datums-/Datetime-Spalten via strftime(fmt)
+    Gibt ein DF zurück, in dem Datums-/Datetime-Spalten via strftime(fmt)
     in Strings konvertiert wurden. Wenn fmt None ist oder pandas fehlt, wird df unverändert
     zurückgegeben.
+
+    Objekt-/String-Spalten werden nur anhand einer Stichprobe (erste
+    _DATE_SNIFF_SAMPLE Nicht-NA-Werte) auf Datumswerte geprüft; nur bei Treffer
+    wird die ganze Spalte konvertiert. Unveränderte Spalten werden nicht kopiert.
     """
     if not fmt:
         return df
+    # Vorprüfung ohne pandas-Import: nur datetime- bzw. Objekt-/String-Spalten
+    # kommen überhaupt in Frage (Iterable[Mapping] hat kein dtypes -> unverändert)
+    dtypes = getattr(df, "dtypes", None)
+    if dtypes is None:
+        return df
+    kinds = {str(t) for t in dtypes}
+    if not any("datetime" in k or k in ("object", "str") for k in kinds):
+        return df
     try:
         import pandas as pd  # noqa: F401
         from pandas.api.types import is_datetime64_any_dtype  # type: ignore
@@ -145,52 +171,82 @@ def _apply_date_format_if_requested(df: Any, fmt: Optional[str]) -> Any:
         # Fallback: keine Formatierung möglich
         return df
 
-    try:
-        out = df.copy()
-    except Exception:
-        # falls kein echtes DF, einfach zurückgeben
-        return df
-
-    for col in getattr(out, "columns", []):
-        s = out[col]
+    changed: Dict[Any, Any] = {}
+    for col in getattr(df, "columns", []):
+        s = df[col]
         # reine datetime64*-Spalten
         try:
             if is_datetime64_any_dtype(s):
-                out[col] = s.dt.strftime(fmt)
+                changed[col] = s.dt.strftime(fmt)
                 continue
         except Exception:
             pass
         # object-Spalten mit überwiegend datetime-ähnlichen Werten
         try:
-            if getattr(s, "dtype", None) == "object":
+            if str(getattr(s, "dtype", "")) in ("object", "str"):
+                sample = s.dropna().head(_DATE_SNIFF_SAMPLE)
+                if len(sample) == 0:
+                    continue
+                if pd.to_datetime(sample, errors="coerce").notna().mean() < 0.5:
+                    continue
                 conv = pd.to_datetime(s, errors="coerce")  # type: ignore[name-defined]
-                non_na = getattr(conv, "notna", lambda: False)()
-                if int(non_na.sum()) >= max(1, int(0.5 * len(s))):
-                    out[col] = conv.dt.strftime(fmt).where(conv.notna(), s)
+                if int(conv.notna().sum()) >= max(1, int(0.5 * len(s))):
+                    changed[col] = conv.dt.strftime(fmt).where(conv.notna(), s)
         except Exception:
             # best-effort, bei Fehlern Spalte unverändert lassen
             pass
+
+    if not changed:
+        return df
+    try:
+        # flache Kopie: nur die ersetzten Spalten werden neu belegt
+        out = df.copy(deep=False)
+    except Exception:
+        # falls kein echtes DF, einfach zurückgeben
+        return df
+    for col, values in changed.items():
+        out[col] = values
     return out
 
 
-def _infer_columns_from_like_df(df: Any) -> Iterable[str]:
-    cols = getattr(df, "columns", None)
-    if cols is not None:
-        return list(cols)
-    # Minimal-Fallback: versuche aus erstem Record
-    records = None
+def _iter_rows(df: Any) -> Tuple[List[str], Iterable[Sequence[Any]]]:
+    """
+    Liefert (Spaltennamen, Zeilen-Iterator). Für DataFrames via itertuples
+    (C-beschleunigt, keine dict-Materialisierung pro Zeile).
+    Die Spaltennamen werden einmalig in str gewandelt und interniert, damit alle
+    Zellen einer Spalte dasselbe Tag-Objekt verwenden.
+    """
+    itertuples = getattr(df, "itertuples", None)
+    if itertuples is not None and getattr(df, "columns", None) is not None:
+        cols = [sys.intern(str(c)) for c in df.columns]
+        return cols, itertuples(index=False, name=None)
+    # generischer Versuch: Iterable[Mapping] – lazy, ohne Liste von dicts
     try:
-        records = list(df)  # type: ignore[assignment]
+        it = iter(df)
+        first = next(it, None)
+        if first is not None and not isinstance(first, Mapping):
+            first = dict(first)
     except Exception:
-        pass
-    if records and isinstance(records[0], dict):
-        return list(records[0].keys())
-    return []
+        raise TypeError(
+            "write_xml: df ist nicht DataFrame-kompatibel (erwartet DataFrame "
+            "oder Iterable[Mapping])."
+        )
+    if first is None:
+        return [], iter(())
+    keys = list(first.keys())
+
+    def _gen() -> Iterator[List[Any]]:
+        yield [first.get(k) for k in keys]
+        for r in it:
+            rec = r if isinstance(r, Mapping) else dict(r)
+            yield [rec.get(k) for k in keys]
+
+    return [sys.intern(str(k)) for k in keys], _gen()
 
 
 def _write_xml_fallback(
     df: Any,
-    target: Path,
+    sink: BinaryIO,
     *,
     encoding: str,
     index: bool,
@@ -200,62 +256,82 @@ def _write_xml_fallback(
     pretty_print: bool,
 ) -> None:
     """
-    Fallback ohne pandas.to_xml: nutzt xml.etree.ElementTree
+    Fallback ohne pandas.to_xml: schreibt zeilenweise (Streaming), ohne den
+    kompletten Baum im Speicher aufzubauen.
+    - mit lxml: inkrementeller Writer `lxml.etree.xmlfile`
+    - sonst: direkter Text-Writer mit XML-Escaping (Standardbibliothek)
+    Der Index wird im Fallback nicht geschrieben. `sink` ist ein binärer,
+    bereits geöffneter Handle (wird nicht geschlossen).
     """
-    import xml.etree.ElementTree as ET
-
-    root = ET.Element(root_name)
-
-    # Records erzeugen
     try:
-        records = df.to_dict(orient="records")  # pandas-like
-    except Exception:
-        # generischer Versuch
-        try:
-            records = [dict(r) for r in df]  # Iterable[Mapping]
-        except Exception:
-            raise TypeError(
-                "write_xml: df ist nicht DataFrame-kompatibel (erwartet .to_dict('records') "
-                "oder Iterable[Mapping])."
-            )
+        from lxml import etree as LET  # type: ignore[import-not-found]
+    except ImportError:
+        LET = None
+
+    cols, rows = _iter_rows(df)
+    nl_row = "\n  " if pretty_print else ""
+    nl_col = "\n    " if pretty_print else ""
+
+    if LET is not None:
+        with LET.xmlfile(sink, encoding=encoding) as xf:
+            if xml_declaration:
+                xf.write_declaration()
+            with xf.element(root_name):
+                wrote_rows = False
+                for rec in rows:
+                    wrote_rows = True
+                    if nl_row:
+                        xf.write(nl_row)
+                    with xf.element(row_name):
+                        for name, val in zip(cols, rec):
+                            if nl_col:
+                                xf.write(nl_col)
+                            with xf.element(name):
+                                if val is not None:
+                                    xf.write(str(val))
+                        if nl_row:
+                            xf.write(nl_row)
+                if wrote_rows and pretty_print:
+                    xf.write("\n")
+        return
 
-    cols = list(_infer_columns_from_like_df(df))
-    for rec in records:
-        row_el = ET.SubElement(root, row_name)
-        # deterministische Spaltenreihenfolge
-        keys = cols if cols else list(rec.keys())
-        for k in keys:
-            v = rec.get(k, None)
-            # None -> leeres Element
-            child = ET.SubElement(row_el, str(k))
-            if v is None:
-                child.text = ""
+    opens = [f"{nl_col}<{c}>" for c in cols]
+    closes = [f"</{c}>" for c in cols]
+    empties = [f"{nl_col}<{c} />" for c in cols]
+    row_open = f"{nl_row}<{row_name}>"
+    row_close = f"{nl_row}</{row_name}>"
+    f = io.TextIOWrapper(sink, encoding=encoding, errors="xmlcharrefreplace", newline="")
+    w = f.write
+    if xml_declaration:
+        w(f"<?xml version='1.0' encoding='{encoding}'?>\n")
+    w(f"<{root_name}>")
+    wrote_rows = False
+    for rec in rows:
+        wrote_rows = True
+        w(row_open)
+        for o, c, e, val in zip(opens, closes, empties, rec):
+            if val is None:
+                w(e)
             else:
-                child.text = str(v)
-
-        if index:
-            # optional Index als Attribut (nicht implementiert im Fallback)
-            pass
-
-    # Pretty Print optional
-    if pretty_print:
-        try:
-            # Einrückung (Python 3.9+)
-            ET.indent(root, space="  ")  # type: ignore[attr-defined]
-        except Exception:
-            pass
-
-    tree = ET.ElementTree(root)
-    with open(target, "wb") as f:
-        if xml_declaration:
-            tree.write(f, encoding=encoding, xml_declaration=True)
-        else:
-            tree.write(f, encoding=encoding, xml_declaration=False)
+                w(o)
+                text = str(val)
+                # Schnelltest: die meisten Zellen enthalten nichts zu Escapendes
+                if _NEEDS_ESCAPE.search(text) is None:
+                    w(text)
+                else:
+                    w(text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;"))
+                w(c)
+        w(row_close)
+    if wrote_rows and pretty_print:
+        w("\n")
+    w(f"</{root_name}>")
+    f.flush()
+    f.detach()
 
 
 def _to_xml_compat(
     df: Any,
-    target: Path,
+    sink: BinaryIO,
     *,
     encoding: str,
     index: bool,
@@ -267,13 +343,13 @@ def _to_xml_compat(
     """
     Ruft DataFrame.to_xml auf, filtert aber strikt nur die Parameter durch,
     die die jeweilige pandas-Version auch unterstützt. Falls .to_xml fehlt,
-    nutzt der Fallback-Writer.
+    nutzt der Fallback-Writer. Geschrieben wird in den offenen Handle `sink`.
     """
     to_xml = getattr(df, "to_xml", None)
     if to_xml is None:
         _write_xml_fallback(
             df,
-            target,
+            sink,
             encoding=encoding,
             index=index,
             root_name=root_name,
@@ -285,12 +361,11 @@ def _to_xml_compat(
 
     # Nur unterstützte Parameter durchreichen
     try:
-        import inspect
-
-        sig = inspect.signature(to_xml)
-        allowed = set(sig.parameters.keys())
+        allowed = _ALLOWED_CACHE.get(type(df))
+        if allowed is None:
+            allowed = frozenset(inspect.signature(to_xml).parameters)
+            _ALLOWED_CACHE[type(df)] = allowed
         kwargs = {
-            "path_or_buffer": target if "path_or_buffer" in allowed else target,
             "index": index if "index" in allowed else None,
             "encoding": encoding if "encoding" in allowed else None,
             "root_name": root_name if "root_name" in allowed else None,
@@ -300,12 +375,15 @@ def _to_xml_compat(
         }
         # Entferne None-Keys und Keys, die nicht erlaubt sind
         clean_kwargs = {k: v for k, v in kwargs.items() if k in allowed and v is not None}
-        to_xml(**clean_kwargs)
+        # pandas schreibt in unseren gepufferten Handle statt selbst (8 KiB) zu öffnen
+        to_xml(sink, **clean_kwargs)
     except Exception:
-        # jede unerwartete Inkompatibilität -> robuster Fallback
+        # jede unerwartete Inkompatibilität -> robuster Fallback (Teilausgabe verwerfen)
+        sink.seek(0)
+        sink.truncate()
         _write_xml_fallback(
             df,
-            target,
+            sink,
             encoding=encoding,
             index=index,
             root_name=root_name,
@@ -328,9 +406,10 @@ def write_xml(
     root_name: str = "data",
     row_name: str = "row",
     xml_declaration: bool = True,
-    pretty_print: bool = True,
+    pretty_print: Optional[bool] = None,
     overwrite: bool = False,
-) -> Path:
+    return_info: bool = False,
+) -> Union[Path, Tuple[Path, Dict[str, Any]]]:
     """
     Schreibt ein DataFrame als XML.
 
@@ -340,11 +419,16 @@ def write_xml(
       an pandas.to_xml übergeben (vermeidet TypeError bei älteren pandas).
     - `directory` erlaubt plattformunabhängig (Windows/Linux) absolute oder relative
       Zielverzeichnisse. Der Rückgabepfad ist absolut.
+    - `pretty_print=None` (Default) rückt nur bis `_PRETTY_PRINT_MAX_ROWS` Zeilen
+      ein; größere DataFrames werden kompakt geschrieben. Explizites True/False
+      wird immer respektiert. Mit `return_info=True` steht die tatsächliche Wahl
+      in info["pretty_print"] (Abschaltung zusätzlich als Hinweis in info["notes"]).
 
     Returns
     -------
-    Path
-        Absoluter Pfad der erzeugten XML-Datei.
+    Path | (Path, dict)
+        Absoluter Pfad der erzeugten XML-Datei; mit return_info=True zusätzlich
+        info = {"path", "rows", "pretty_print", "pretty_print_auto", "notes"}.
 
     Examples
     --------
@@ -361,28 +445,57 @@ def write_xml(
         directory=directory,
     )
 
-    if target.exists() and not overwrite:
-        target = _next_free_path(target)
-
     # Zielordner anlegen
     target.parent.mkdir(parents=True, exist_ok=True)
 
     # Vorformatierung von Datumsfeldern (NICHT an to_xml weiterreichen!)
     df_to_write = _apply_date_format_if_requested(df, date_format)
 
-    # pandas >= 1.3: to_xml vorhanden; sonst Fallback
-    _to_xml_compat(
-        df_to_write,
-        target,
-        encoding=encoding,
-        index=index,
-        root_name=root_name,
-        row_name=row_name,
-        xml_declaration=xml_declaration,
-        pretty_print=pretty_print,
-    )
+    # pretty_print automatisch: große DataFrames kompakt schreiben
+    shape = getattr(df_to_write, "shape", None)
+    rows = shape[0] if shape else None
+    notes: List[str] = []
+    pretty_print_auto = pretty_print is None
+    if pretty_print_auto:
+        pretty_print = not (rows is not None and rows > _PRETTY_PRINT_MAX_ROWS)
+        if not pretty_print:
+            notes.append(
+                f"pretty_print automatisch deaktiviert: {rows} Zeilen > {_PRETTY_PRINT_MAX_ROWS} "
+                "(pretty_print=True erzwingt Einrückung)"
+            )
 
+    # Datei öffnen (bei overwrite=False exklusiv angelegt, ggf. mit Suffix _001, ...)
+    target, sink = _open_target(target, overwrite)
+    try:
+        with sink:
+            # pandas >= 1.3: to_xml vorhanden; sonst Fallback
+            _to_xml_compat(
+                df_to_write,
+                sink,
+                encoding=encoding,
+                index=index,
+                root_name=root_name,
+                row_name=row_name,
+                xml_declaration=xml_declaration,
+                pretty_print=pretty_print,
+            )
+    except BaseException:
+        # keine halbfertige Datei zurücklassen
+        try:
+            target.unlink()
+        except OSError:
+            pass
+        raise
+
+    if return_info:
+        return target, {
+            "path": target,
+            "rows": rows,
+            "pretty_print": pretty_print,
+            "pretty_print_auto": pretty_print_auto,
+            "notes": notes,
+        }
     return target
 
 
-__all__ = ["build_xml_path", "write_xml"]
+__all__ = ["build_xml_path", "write_xml", "begin_batch", "end_batch"]
@@ -31,11 +31,19 @@ Version: 1.0.0 (2025-09-11)
 """
 from __future__ import annotations
 
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import json
 
+try:  # optional: schneller JSON-Parser (arbeitet direkt auf bytes)
+    import orjson  # type: ignore
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _loads = json.loads  # akzeptiert ebenfalls bytes (UTF-8)
+
 from .schema import ParamSchema, default_sharepoint_job_schema
 
 
@@ -46,7 +54,8 @@ def load_param_json(param_json_path: Union[str, Path]) -> Dict[str, Any]:
     if not p.exists():
         raise FileNotFoundError(f"Parameter JSON not found: {param_json_path}")
     try:
-        obj = json.loads(p.read_text(encoding="utf-8"))
+        # bytes direkt parsen: spart den Umweg über einen dekodierten str
+        obj = _loads(p.read_bytes())
     except Exception as ex:
         raise RuntimeError(f"Failed to parse parameter JSON '{param_json_path}': {ex}")
     if "jobs" not in obj or not isinstance(obj["jobs"], list):
@@ -60,17 +69,16 @@ def load_param_json(param_json_path: Union[str, Path]) -> Dict[str, Any]:
 
 def _ns_to_dict(ns: Any, keys: Sequence[str]) -> Dict[str, Any]:
     """Extrahiert nur relevante Keys aus einem argparse.Namespace (oder dict)."""
-    out: Dict[str, Any] = {}
     if ns is None:
-        return out
+        return {}
     if isinstance(ns, dict):
-        src = ns
+        get = ns.get
     else:
-        src = vars(ns)
-    for k in keys:
-        if k in src and src[k] is not None:
-            out[k] = src[k]
-    return out
+        # direkter Attributzugriff statt vars(ns): kein Zwischen-dict,
+        # funktioniert auch für Objekte ohne __dict__ (z. B. __slots__)
+        def get(k: str, _ns: Any = ns) -> Any:
+            return getattr(_ns, k, None)
+    return {k: v for k in keys if (v := get(k)) is not None}
 
 
 def _merge_priority(*sources: Dict[str, Any]) -> Dict[str, Any]:
@@ -86,6 +94,15 @@ def _merge_priority(*sources: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
+# Werte dieser Typen dürfen sich Jobs teilen; alles andere wird je Job kopiert
+_SHARED_OK = (str, int, float, bool, type(None), Path, tuple, frozenset)
+
+
+def _own_value(val: Any) -> Any:
+    """Geerbter Basiswert für einen Job: veränderliche Werte (z. B. COLUMNS-Liste) kopieren."""
+    return val if isinstance(val, _SHARED_OK) else copy.copy(val)
+
+
 @dataclass
 class ResolveInfo:
     """Diagnose-Objekt zur Auflösung."""
@@ -106,6 +123,7 @@ def resolve_mode_and_jobs_generic(
     param_json_path: Optional[Union[str, Path]] = None,
     schema: Optional[ParamSchema] = None,
     keys_of_interest: Optional[Sequence[str]] = None,
+    parallel: int = 1,
 ) -> Tuple[str, List[Dict[str, Any]], ResolveInfo]:
     """
     Ermittelt die effektive Job-Liste gemäß MODE & Quellen.
@@ -117,6 +135,11 @@ def resolve_mode_and_jobs_generic(
         param_json_path: Pfad auf Parameter-JSON (für MODE='json')
         schema: ParamSchema (Default: default_sharepoint_job_schema())
         keys_of_interest: welche CLI-Keys übernommen werden (Default: SharePoint-Standard)
+        parallel: Anzahl Worker-Threads für die Job-Auflösung bei MODE='json'
+                  (Default 1 = sequentiell; max. 8). Reihenfolge der Jobs und
+                  Fehler bleibt erhalten. Lohnt nur bei eigenen coercer-Funktionen
+                  mit I/O (z. B. Pfad-/Netzwerkprüfungen), da reine Python-Coercion
+                  durch die GIL serialisiert wird.
 
     Rückgabe:
         (mode, jobs_clean, info)
@@ -159,9 +182,48 @@ def resolve_mode_and_jobs_generic(
         jobs = obj["jobs"]
 
         # Für jeden Job: CONFIG < JSON-defaults < JOB < CLI
-        for job in jobs:
-            merged = _merge_priority(cfg, json_defaults, job, cli_dict)
-            clean, errs = schema.coerce_and_validate(merged)
+        # CONFIG + JSON-defaults + CLI sind für alle Jobs gleich -> einmal
+        # mergen und validieren; je Job werden nur die Job-eigenen Felder
+        # coerced und auf die validierte Basis gelegt.
+        base = _merge_priority(cfg, json_defaults, cli_dict)
+        base_clean, _ = schema.coerce_and_validate(base)
+        base_errs = {
+            canon: err
+            for canon, val in base_clean.items()
+            if (err := schema.field_error(canon, val)) is not None
+        }
+        cli_canon = {schema.canonical_key(k) for k in cli_dict}
+
+        def _resolve_job(job: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+            # CLI gewinnt gegenüber dem Job -> diese Keys nicht überschreiben
+            override = {
+                k: v for k, v in (job or {}).items()
+                if schema.canonical_key(k) not in cli_canon
+            }
+            job_clean, _ = schema.coerce_and_validate_subset(override)
+            # Zusammenführen in Schema-Reihenfolge (wie base_clean), damit auch
+            # die Fehler in Feldreihenfolge erscheinen
+            clean: Dict[str, Any] = {}
+            errs: List[str] = []
+            for canon, base_val in base_clean.items():
+                if canon in job_clean:
+                    val = clean[canon] = job_clean[canon]
+                    err = schema.field_error(canon, val)
+                else:
+                    clean[canon] = _own_value(base_val)
+                    err = base_errs.get(canon)
+                if err is not None:
+                    errs.append(err)
+            return clean, errs
+
+        workers = min(8, int(parallel or 1), len(jobs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                results = list(ex.map(_resolve_job, jobs))
+        else:
+            results = map(_resolve_job, jobs)
+
+        for job, (clean, errs) in zip(jobs, results):
             if errs:
                 errors_all.extend([f"job: {job} -> " + e for e in errs])
             else:
@@ -26,28 +26,49 @@ Version: 1.0.0 (2025-09-11)
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 
 # ---------------------------- Coercion-Hilfsfunktionen ------------------------
 
+_BOOL_TRUE = frozenset({"1", "true", "t", "y", "yes", "on"})
+_BOOL_FALSE = frozenset({"0", "false", "f", "n", "no", "off"})
+
+
 def coerce_bool(val: Any, default: Optional[bool] = None) -> Optional[bool]:
     if val is None:
         return default
     if isinstance(val, bool):
         return val
     s = str(val).strip().lower()
-    if s in ("1", "true", "t", "y", "yes", "on"):
+    if s in _BOOL_TRUE:
         return True
-    if s in ("0", "false", "f", "n", "no", "off"):
+    if s in _BOOL_FALSE:
         return False
     return default
 
 
 def coerce_int(val: Any, default: Optional[int] = None) -> Optional[int]:
-    if val is None or str(val).strip() == "":
+    if type(val) is int:  # bereits int (bool bewusst ausgenommen)
+        return val
+    if val is None:
+        return default
+    if isinstance(val, str):
+        # häufigster Fall: ohne Exception als Kontrollfluss prüfen
+        s = val.strip()
+        if not s:
+            return default
+        digits = s[1:] if s[0] in "+-" else s
+        if digits.isdecimal():
+            return int(s)
+        if "_" not in digits:
+            return default
+        # selten: Ziffern mit Unterstrich ("1_000") -> int() entscheidet
+    elif str(val).strip() == "":
         return default
     try:
         return int(val)
@@ -75,24 +96,48 @@ def coerce_columns(val: Any, default: Optional[List[str]] = None) -> Optional[Li
     """
     Akzeptiert:
         - None oder "" oder "*"  → None (steht für "alle Felder")
-        - List[str]               → normalisiert getrimmte Strings
+        - List[str]/Tuple[str]    → normalisiert getrimmte Strings
         - Kommagetrennte Strings  → Liste
     """
     if val is None:
         return None
-    if isinstance(val, list):
-        cols = [str(c).strip() for c in val if str(c).strip()]
+    if isinstance(val, (list, tuple)):
+        # schon saubere Liste (getrimmte, nicht-leere Strings) -> nur kopieren
+        if val and all(type(c) is str and c and c == c.strip() for c in val):
+            return list(val)
+        cols = [c for c in (str(c).strip() for c in val) if c]
         return cols or None
     s = str(val).strip()
     if s == "" or s == "*":
         return None
-    cols = [c.strip() for c in s.split(",") if c and c.strip()]
+    cols = [c for c in (p.strip() for p in s.split(",")) if c]
     return cols or None
 
 
+# kind -> Coercion-Funktion (ersetzt die if/elif-Kette in Field.coerce)
+_COERCERS: Dict[str, Callable[[Any, Any], Any]] = {
+    "str": coerce_str,
+    "int": coerce_int,
+    "bool": coerce_bool,
+    "path": coerce_path,
+    "columns": coerce_columns,
+}
+
+
+# Marker für "nicht im Cache" (None ist ein gültiges Ergebnis von canonical_key)
+_MISSING: Any = object()
+
+# Obergrenze für den canonical_key-Memo je Schema (Schutz vor beliebigen Roh-Keys)
+_CANONICAL_CACHE_MAX = 4096
+
+
+# __slots__ für Field/ParamSchema (dataclass(slots=...) ab Python 3.10)
+_DC_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 # ------------------------------- Felddefinition -------------------------------
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class Field:
     """
     Ein Feld im Schema mit Coercion-Strategie.
@@ -111,22 +156,11 @@ class Field:
     help: str = ""
 
     def coerce(self, value: Any) -> Any:
-        if self.coercer is not None:
-            return self.coercer(value, self.default)
-
-        if self.kind == "bool":
-            return coerce_bool(value, self.default)
-        if self.kind == "int":
-            return coerce_int(value, self.default)
-        if self.kind == "path":
-            return coerce_path(value, self.default)
-        if self.kind == "columns":
-            return coerce_columns(value, self.default)
-        # default: str
-        return coerce_str(value, self.default)
-
-
-@dataclass
+        # eigener coercer hat Vorrang; unbekannte 'kind' -> str
+        return (self.coercer or _COERCERS.get(self.kind, coerce_str))(value, self.default)
+
+
+@dataclass(**_DC_SLOTS)
 class ParamSchema:
     """
     Sammlung von Feldern mit Coercion/Validierung.
@@ -137,18 +171,48 @@ class ParamSchema:
 
     # Map: alias_lower → canonical
     _alias_map: Dict[str, str] = field(default_factory=dict, init=False)
+    # Memo: Roh-Key → canonical|None (spart str()/lower() bei wiederkehrenden Keys)
+    _canonical_cache: Dict[Any, Optional[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Spaltenweise Sicht (SoA) auf die Felder – parallel zu _names indiziert
+    _names: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _coercers: Tuple[Callable[[Any, Any], Any], ...] = field(default=(), init=False, repr=False, compare=False)
+    _defaults: Tuple[Any, ...] = field(default=(), init=False, repr=False, compare=False)
+    _required: Tuple[bool, ...] = field(default=(), init=False, repr=False, compare=False)
+    _choices: Tuple[Optional[Sequence[Any]], ...] = field(default=(), init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        # Feldnamen/Aliase internieren: Dict-Lookups treffen dann per Identität
+        intern = sys.intern
+        self.fields = {intern(str(canon)): f for canon, f in self.fields.items()}
         amap: Dict[str, str] = {}
         for canon, f in self.fields.items():
-            amap[canon.lower()] = canon
+            amap[intern(canon.lower())] = canon
             for a in f.aliases:
-                amap[str(a).lower()] = canon
+                amap[intern(str(a).lower())] = canon
         self._alias_map = amap
+        self._canonical_cache = {}
+
+        flds = tuple(self.fields.values())
+        self._names = tuple(self.fields)
+        self._index = {canon: i for i, canon in enumerate(self._names)}
+        self._coercers = tuple(_coercer_of(f) for f in flds)
+        self._defaults = tuple(f.default for f in flds)
+        self._required = tuple(bool(f.required) for f in flds)
+        self._choices = tuple(f.choices for f in flds)
 
     def canonical_key(self, key: str) -> Optional[str]:
         """Ermittelt den kanonischen Feldnamen für 'key' (inkl. Aliasauflösung)."""
-        return self._alias_map.get(str(key).lower())
+        cache = self._canonical_cache
+        canon = cache.get(key, _MISSING)
+        if canon is _MISSING:
+            canon = self._alias_map.get(str(key).lower())
+            if len(cache) >= _CANONICAL_CACHE_MAX:
+                cache.clear()
+            cache[key] = canon
+        return canon
 
     def coerce_and_validate(self, raw: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
         """
@@ -158,42 +222,112 @@ class ParamSchema:
         - clean: nur bekannte Felder (kanonische Keys), coerced
         - errors: Liste Fehlertexte
         """
+        get = self._collect_provided(raw).get
+        check = self._check
         clean: Dict[str, Any] = {}
         errors: List[str] = []
+        for i, (canon, coerce, default) in enumerate(zip(self._names, self._coercers, self._defaults)):
+            val = clean[canon] = coerce(get(canon), default)
+            err = check(i, val)
+            if err is not None:
+                errors.append(err)
+        return clean, errors
 
-        # 1) Rohwerte sammeln (inkl. Aliasauflösung)
+    def coerce_and_validate_subset(
+        self,
+        raw: Dict[str, Any],
+        keys: Optional[Iterable[str]] = None,
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Wie coerce_and_validate, jedoch nur für eine Teilmenge der Felder:
+        - keys=None: alle in 'raw' vorhandenen (bekannten) Felder
+        - sonst:     die in 'keys' genannten Felder (Aliase erlaubt)
+        Felder außerhalb der Teilmenge fehlen in 'clean' und werden nicht geprüft.
+        Gedacht für Overrides auf einer bereits validierten Basis:
+            clean = {**base_clean, **subset_clean}
+        """
+        provided = self._collect_provided(raw)
+        if keys is None:
+            names = list(provided)
+        else:
+            names = [c for c in (self.canonical_key(k) for k in keys) if c is not None]
+
+        index, coercers, defaults = self._index, self._coercers, self._defaults
+        clean: Dict[str, Any] = {}
+        errors: List[str] = []
+        for canon in names:
+            i = index[canon]
+            val = coercers[i](provided.get(canon, None), defaults[i])
+            err = self._check(i, val)
+            if err is not None:
+                errors.append(err)
+            clean[canon] = val
+        return clean, errors
+
+    def field_error(self, key: str, value: Any) -> Optional[str]:
+        """Prüft einen bereits coerced Wert (required/choices); None == gültig."""
+        canon = self.canonical_key(key)
+        if canon is None:
+            return None
+        return self._check(self._index[canon], value)
+
+    def _collect_provided(self, raw: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Rohwerte auf kanonische Keys abbilden; unbekannte Felder entfallen."""
         provided: Dict[str, Any] = {}
         for k, v in (raw or {}).items():
             canon = self.canonical_key(k)
             if canon is None:
                 continue  # unbekanntes Feld ignorieren
             provided[canon] = v
+        return provided
+
+    def _check(self, i: int, val: Any) -> Optional[str]:
+        if val is None:
+            if self._required[i]:
+                return f"Missing required parameter: {self._names[i]}"
+            return None
+        choices = self._choices[i]
+        if choices is not None and val not in choices:
+            return f"Invalid value for {self._names[i]!r}: {val!r}. Allowed: {choices}"
+        return None
 
-        # 2) Coercion & Defaults
-        for canon, field in self.fields.items():
-            val_raw = provided.get(canon, None)
-            val = field.coerce(val_raw)
-            if val is None and field.required:
-                errors.append(f"Missing required parameter: {canon}")
-            if val is not None and field.choices is not None:
-                if val not in field.choices:
-                    errors.append(f"Invalid value for {canon!r}: {val!r}. Allowed: {field.choices}")
-            clean[canon] = val
 
-        return clean, errors
+# ------------------------------ Coercion je Feld ------------------------------
+
+def _coercer_of(f: Field) -> Callable[[Any, Any], Any]:
+    """Coercion-Funktion (value, default) für ein Feld; Unterklassen mit eigener coerce() werden gekapselt."""
+    if type(f).coerce is Field.coerce:
+        return f.coercer or _COERCERS.get(f.kind, coerce_str)
+    bound = f.coerce
+    return lambda value, _default: bound(value)
 
 
 # --------------------------- Vordefiniertes Schema ----------------------------
 
-def default_sharepoint_job_schema() -> ParamSchema:
+def default_sharepoint_job_schema(copy: bool = False) -> ParamSchema:
     """
     Standard-Schema für SharePoint-List-Loads (Items → DataFrame).
+    Wird einmalig gebaut und als gemeinsame Instanz zurückgegeben – die
+    Instanz darf nicht verändert werden. copy=True liefert ein eigenes,
+    frisch gebautes Schema (z. B. um Felder zu ergänzen).
+
     - COLUMNS: None == '*' (alle Felder)
     - TOP: optional (clientseitiges Limit)
     - CreateCSV/Display: bool
     - CSVDir/CSVFile: Pfade (optional)
     - TZPolicy: String (z. B. 'utc+2')
     """
+    if copy:
+        return _build_default_sharepoint_job_schema()
+    return _default_sharepoint_job_schema_shared()
+
+
+@lru_cache(maxsize=1)
+def _default_sharepoint_job_schema_shared() -> ParamSchema:
+    return _build_default_sharepoint_job_schema()
+
+
+def _build_default_sharepoint_job_schema() -> ParamSchema:
     fields = {
         "SITE_URL":   Field("SITE_URL", kind="str",  required=True,  help="SharePoint Site URL"),
         "LIST_TITLE": Field("LIST_TITLE", kind="str", required=True,  help="SharePoint List Display Title"),
@@ -44,18 +44,25 @@ Sicherheitsprinzipien
   werden (`keep_existing_password=True`), wenn der neue Kandidat nur den
   Platzhalter liefert.
 - **Atomare Writes**: Updates werden über eine temporäre Datei und `os.replace`
-  durchgeführt; optional wird vorab ein Backup angelegt.
+  durchgeführt; vorher wird (Default) ein Backup `<config>.bak-<ts>` angelegt,
+  optional jede Änderung zusätzlich (maskiert) im Journal `.config.journal.jsonl`
+  protokolliert.
 
 Öffentliche API
 ---------------
 - `connect_and_check(node, *, show_drivers=True, show_dsns=True, return_config_json=True,
                      write_config=False, config_path=CONFIG_PATH, keep_existing_password=True,
-                     dry_run=False) -> (ok: bool, diag: dict, config_json: str|None, write_info: dict|None)`
+                     dry_run=False, verbose=True) -> (ok: bool, diag: dict, config_json: str|None, write_info: dict|None)`
+- `connect_and_check_many(nodes, *, ..., diag_ttl_s=300.0) -> {node: (ok, diag, config_json, write_info)}`
+  (Batch: Treiber/DSNs einmal, geteilte Diagnose je identischer Verbindung)
 
 - `build_config_candidate(settings, diag) -> dict`
 - `render_config_json(node, entry) -> str`
 - `apply_config_update(*, config_path, node, new_entry, create_backup=True,
-                       keep_existing_password=True, dry_run=False) -> dict`
+                       keep_existing_password=True, dry_run=False,
+                       expected_prev_sha256=None, journal=False) -> dict`
+- `apply_config_updates(*, config_path, updates=[(node, entry), ...], ...) -> dict`
+  (Batch: einmal lesen, einmal schreiben)
 - `quick_check(engine) -> Any` (optional, erfordert SQLAlchemy)
 - `show_settings(settings) -> None` (maskierte Kurzansicht)
 
@@ -105,18 +112,47 @@ Umgebungsvariablen berücksichtigt (best effort):
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import io
 import json
 import os
-import shutil
-import tempfile
-from datetime import datetime
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
 
-# Optional: nur für quick_check; kann entfernt werden, wenn nicht genutzt
+# Optional: schneller JSON-Parser/-Serializer für config.json
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# Parse-Fallback ohne orjson: ujson (nur loads; dumps formatiert abweichend)
 try:
-    from sqlalchemy import text  # type: ignore
-except Exception:  # pragma: no cover
-    text = None  # type: ignore
+    import ujson  # type: ignore
+except ImportError:  # pragma: no cover
+    ujson = None  # type: ignore
+
+if orjson is not None:
+    _loads = orjson.loads
+elif ujson is not None:  # pragma: no cover
+    _loads = ujson.loads
+else:  # pragma: no cover
+    _loads = json.loads
+
+def _dumps(obj: Any) -> str:
+    """JSON mit indent=2 (UTF-8, ohne ASCII-Escaping) als str; orjson wenn verfügbar."""
+    return _dump_json_bytes(obj, trailing_newline=False).decode("utf-8")
+
+# Optional: nur für quick_check; kann entfernt werden, wenn nicht genutzt
+# SQLAlchemy nur für quick_check -> lazy; TextClause wird beim ersten Aufruf
+# einmalig erzeugt (statt text(...) je Aufruf)
+_SELECT_1: Any = None
 
 # --- Primär: genau wie im funktionierenden Altcode ---------------------------
 try:
@@ -149,6 +185,18 @@ except Exception as _ex:  # pragma: no cover
             ],
         }
 
+# Treiber-/DSN-Listen ändern sich praktisch nie während eines Laufs (Windows:
+# Registry-Scan je Aufruf) -> für die Ausgabe in connect_and_check mit TTL cachen
+_ODBC_LIST_TTL_S = 60.0
+_ODBC_LIST_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+def _cached_odbc_listing(kind: str, fn) -> Any:
+    now = time.monotonic()
+    hit = _ODBC_LIST_CACHE.get(kind)
+    if hit is None or now - hit[0] > _ODBC_LIST_TTL_S:
+        hit = _ODBC_LIST_CACHE[kind] = (now, fn())
+    return hit[1]
+
 # --- Sekundär: Fallback-Loader (wenn `core.config` nicht vorhanden) ----------
 try:
     from graphfw.params.resolve import CONFIG_PATH as _CONFIG_PATH_FROM_RESOLVE  # type: ignore
@@ -161,36 +209,116 @@ CONFIG_PATH = (
     else os.environ.get("GRAPHFW_CONFIG_PATH", "config.json")
 )
 
+# Geparste JSON-Dateien: abspath -> ((st_ino, st_mtime_ns, st_size), data, rohbytes)
+# Einziger Cache für config.json: der Fallback-Loader liest immer hierüber.
+# st_ino erkennt atomar ersetzte Dateien (os.replace) auch bei gleicher Größe
+# innerhalb desselben mtime-Ticks.
+# Die gecachten Objekte werden nie verändert (Rückgabe immer als deepcopy);
+# der Lock schützt nur die Dict-Zugriffe (z. B. parallele connect_and_check-Läufe).
+# LRU-begrenzt, damit Tools über viele Config-Dateien den Speicher nicht aufblähen.
+_CONFIG_CACHE_MAX = 32
+_CONFIG_CACHE: "OrderedDict[str, Tuple[Tuple[int, int, int], Any, bytes]]" = OrderedDict()
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+def _invalidate_config_cache(path: Optional[str] = None) -> None:
+    """Verwirft den Cache-Eintrag für 'path' (None: alle Einträge)."""
+    with _CONFIG_CACHE_LOCK:
+        if path is None:
+            _CONFIG_CACHE.clear()
+        else:
+            _CONFIG_CACHE.pop(os.path.abspath(path), None)
+
+def _read_json_cached(path: str) -> Any:
+    """
+    Liest und parst eine JSON-Datei; das Ergebnis wird je Pfad gecacht und über
+    (inode, mtime_ns, size) invalidiert. Rückgabe ist eine tiefe Kopie (Aufrufer dürfen
+    mutieren). Eine leere Datei ergibt {} (ohne parse). Parse-/OS-Fehler
+    werden unverändert weitergereicht.
+    """
+    return _read_json_cached_raw(path)[0]
+
+def _read_json_cached_raw(path: str) -> Tuple[Any, bytes]:
+    """Wie _read_json_cached, liefert zusätzlich die Rohbytes der Datei (gecacht)."""
+    key = os.path.abspath(path)
+    # ein open + fstat statt exists()/stat()/open(): FileNotFoundError geht an den Aufrufer
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_size == 0:
+            return {}, b""  # leere Datei (z. B. Erststart) wie fehlende behandeln
+        sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with _CONFIG_CACHE_LOCK:
+            hit = _CONFIG_CACHE.get(key)
+            if hit is not None:
+                _CONFIG_CACHE.move_to_end(key)
+        if hit is None or hit[0] != sig:
+            raw = f.read()
+            hit = (sig, _loads(raw), raw)
+            with _CONFIG_CACHE_LOCK:
+                _CONFIG_CACHE[key] = hit
+                _CONFIG_CACHE.move_to_end(key)
+                while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+                    _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(hit[1]), hit[2]
+
+# ENV-Overrides des Fallback-Loaders: (Feld, ENV-Variablen in Priorität)
+_ENV_MAP: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("server", ("SQL_SERVER", "DB_SERVER")),
+    ("db_name", ("SQL_DATABASE", "DB_NAME", "DATABASE")),
+    ("username", ("SQL_USERNAME", "DB_USER", "USER")),
+    ("password", ("SQL_PASSWORD", "DB_PASSWORD", "PASSWORD")),
+    ("driver", ("SQL_DRIVER", "ODBC_DRIVER")),
+    ("dsn", ("SQL_DSN", "ODBC_DSN")),
+    ("auth", ("SQL_AUTH",)),
+    ("trusted_connection", ("SQL_TRUSTED_CONNECTION",)),
+)
+
+# Felder, deren ENV-Wert als Bool interpretiert wird
+_BOOL_KEYS = frozenset({"trusted_connection"})
+_BOOL_TRUE = frozenset({"1", "true", "yes", "y"})
+
+# Ersatzwert für Geheimnisse in Ausgaben/Journal
+_MASK = "******"
+
+# Passwort-Platzhalter in Vorschlägen (wird beim Merge als "kein Passwort" erkannt)
+_PASSWORD_PLACEHOLDER = "<<<SET_SECRET_HERE>>>"
+
 class _SimpleSettings:
     """Minimaler Settings-Wrapper mit as_dict(mask_secrets=...) kompatibel zur bisherigen Nutzung."""
+    _SECRET_KEYS = ("password", "pwd", "secret")
+
     def __init__(self, data: Dict[str, Any]) -> None:
         self._data = dict(data or {})
+        # einmalig prüfen, ob überhaupt etwas zu maskieren ist
+        self._has_secret = any(k in self._data for k in self._SECRET_KEYS)
+        # Ergebnis von _normalize_settings_dict (lazy, s. dort)
+        self._norm_cache: Optional[Dict[str, Any]] = None
 
     def as_dict(self, *, mask_secrets: bool = True) -> Dict[str, Any]:
         d = dict(self._data)
-        if mask_secrets:
-            for k in ("password", "pwd", "secret"):
-                if k in d and isinstance(d[k], str) and d[k]:
-                    d[k] = "******"
+        if mask_secrets and self._has_secret:
+            for k in self._SECRET_KEYS:
+                v = d.get(k)
+                if isinstance(v, str) and v:
+                    d[k] = _MASK
         return d
 
-def _split_node_path(node_path: str) -> List[str]:
-    return [p for p in (node_path or "").split(".") if p]
-
 def _simple_load_sql_settings(config_path: str, node: str, env_override: bool = True) -> Tuple[_SimpleSettings, Dict[str, Any]]:
     """
     Sehr einfacher Loader: liest JSON, nimmt root['sql'][*node_parts*] und packt es in _SimpleSettings.
     env_override=True: überschreibt mit ENV-Variablen (z. B. SQL_*), inkl. SQL_AUTH und SQL_PARAMS_JSON.
+    Das Parsen läuft über den Config-Cache (_read_json_cached, liefert eine eigene Kopie).
     """
-    info: Dict[str, Any] = {"source": os.path.abspath(config_path), "node_path": f"sql.{node}"}
-    if not os.path.exists(config_path):
+    abs_path = os.path.abspath(config_path)
+    info: Dict[str, Any] = {"source": abs_path, "node_path": f"sql.{node}"}
+    try:
+        data = _read_json_cached(abs_path)
+    except FileNotFoundError:
         data = {}
-    else:
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
 
     cur: Any = data.get("sql", {})
-    for part in _split_node_path(node):
+    for part in (node or "").split("."):
+        if not part:  # leere Segmente ("a..b", führender Punkt) überspringen
+            continue
         if isinstance(cur, dict) and part in cur:
             cur = cur[part]
         else:
@@ -202,29 +330,19 @@ def _simple_load_sql_settings(config_path: str, node: str, env_override: bool =
 
     # ENV-Overrides (best-effort)
     if env_override:
-        env_map = {
-            "server": ["SQL_SERVER", "DB_SERVER"],
-            "db_name": ["SQL_DATABASE", "DB_NAME", "DATABASE"],
-            "username": ["SQL_USERNAME", "DB_USER", "USER"],
-            "password": ["SQL_PASSWORD", "DB_PASSWORD", "PASSWORD"],
-            "driver": ["SQL_DRIVER", "ODBC_DRIVER"],
-            "dsn": ["SQL_DSN", "ODBC_DSN"],
-            "auth": ["SQL_AUTH"],
-            "trusted_connection": ["SQL_TRUSTED_CONNECTION"],
-        }
-        for key, env_keys in env_map.items():
-            for ek in env_keys:
-                if ek in os.environ and os.environ[ek] != "":
-                    val: Any = os.environ[ek]
-                    if key == "trusted_connection":
-                        val = str(val).lower() in ("1", "true", "yes", "y")
-                    cur[key] = val
-                    break
+        env_get = os.environ.get
+        for key, env_keys in _ENV_MAP:
+            val: Any = next((v for v in map(env_get, env_keys) if v), None)
+            if val is None:
+                continue
+            if key in _BOOL_KEYS:
+                val = str(val).lower() in _BOOL_TRUE
+            cur[key] = val
         # params als JSON-Dict erlauben
-        params_json = os.environ.get("SQL_PARAMS_JSON")
+        params_json = env_get("SQL_PARAMS_JSON")
         if params_json:
             try:
-                cur["params"] = json.loads(params_json)
+                cur["params"] = _loads(params_json)
             except Exception:
                 pass
 
@@ -246,10 +364,15 @@ def load_sql_settings(config_path: str, node: str, env_override: bool = True):
 
 def quick_check(engine) -> Any:
     """Führt SELECT 1 aus und gibt das Ergebnis zurück (nur mit SQLAlchemy verfügbar)."""
-    if text is None:
-        raise RuntimeError("SQLAlchemy nicht verfügbar – quick_check kann nicht ausgeführt werden.")
+    global _SELECT_1
+    if _SELECT_1 is None:
+        try:
+            from sqlalchemy import text  # type: ignore
+        except Exception as ex:  # pragma: no cover
+            raise RuntimeError("SQLAlchemy nicht verfügbar – quick_check kann nicht ausgeführt werden.") from ex
+        _SELECT_1 = text("SELECT 1")
     with engine.connect() as c:
-        return c.execute(text("SELECT 1")).scalar()
+        return c.execute(_SELECT_1).scalar()
 
 def show_settings(settings) -> None:
     """Kompakte, maskierte Ausgabe gängiger Felder."""
@@ -257,40 +380,107 @@ def show_settings(settings) -> None:
     keys = ("server", "db_name", "username", "driver", "dsn", "auth", "params")
     print({k: d[k] for k in keys if k in d})
 
+# auth-Modi mit bzw. ohne Passwort (Vergleich in Kleinschreibung)
+_PASSWORD_AUTHS = frozenset({"sql", "aad-password", "aad-sp"})
+_PASSWORDLESS_AUTHS = frozenset({"trusted", "aad-integrated", "aad-interactive", "aad-msi"})
+
+def _auth_lower(auth: Any) -> str:
+    """auth-Wert für den Vergleich mit _PASSWORD_AUTHS/_PASSWORDLESS_AUTHS (None -> "")."""
+    return auth.lower() if type(auth) is str else str(auth or "").lower()
+
+# Schlüsselreihenfolge eines SQL-Eintrags in config.json
+_ORDERED_KEYS = (
+    "dsn", "driver", "server", "db_name", "username", "password",
+    "auth", "trusted_connection", "params",
+)
+# Keys aus _ORDERED_KEYS ohne Sonderbehandlung (zwischen dsn und password)
+_PLAIN_KEYS_BEFORE_PASSWORD = _ORDERED_KEYS[1:5]
+
+# Zeichen, bei denen parse_qsl von der ODBC-Semantik abweichen würde
+_QS_SLOW_CHARS = frozenset("%+ \t\r\n;")
+
+# Schlüssel-Fallbacks (erste nicht-leere Angabe gewinnt)
+_SERVER_KEYS = ("server", "host", "hostname")
+_DB_KEYS = ("db_name", "database", "db")
+_USER_KEYS = ("username", "user", "uid")
+_PASSWORD_KEYS = ("password", "pwd")
+_DRIVER_KEYS = ("driver", "provider")
+
+def _first(d: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Erster truthy Wert zu 'keys' in d (sonst None)."""
+    get = d.get
+    for k in keys:
+        v = get(k)
+        if v:
+            return v
+    return None
+
+# Normalisierte Settings für duck-typed Settings-Objekte (nicht _SimpleSettings)
 def _normalize_settings_dict(settings) -> Dict[str, Any]:
+    """
+    Normalisiert Settings auf die Felder des config.json-Blocks.
+    Nur _SimpleSettings (nach dem Laden unverändert) cachen das Ergebnis am
+    Objekt; andere Settings-Objekte können sich ändern und werden jedes Mal
+    neu normalisiert. Zurückgegeben wird stets eine eigene Kopie.
+    """
+    if isinstance(settings, _SimpleSettings):
+        norm = settings._norm_cache
+        if norm is None:
+            norm = settings._norm_cache = _compute_normalized_settings(settings)
+        return _copy_normalized(norm)
+    return _compute_normalized_settings(settings)
+
+def _copy_normalized(norm: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(norm)
+    if "params" in out:
+        out["params"] = dict(out["params"])
+    return out
+
+def _compute_normalized_settings(settings) -> Dict[str, Any]:
     d = settings.as_dict(mask_secrets=False) if hasattr(settings, "as_dict") else dict(settings or {})
-    # params kann Dict ODER String sein – beides unterstützen
-    params = d.get("params")
+    get = d.get
+    # params kann Dict ODER String sein – beides unterstützen; sonst 'options'
+    params = get("params")
     if isinstance(params, str):
         params = _parse_params_qs(params)
+    if not isinstance(params, dict):
+        params = get("options")
+        if not isinstance(params, dict):
+            params = None
     norm = {
-        "server": d.get("server") or d.get("host") or d.get("hostname"),
-        "db_name": d.get("db_name") or d.get("database") or d.get("db"),
-        "username": d.get("username") or d.get("user") or d.get("uid"),
-        "password": d.get("password") or d.get("pwd"),
-        "driver": d.get("driver") or d.get("provider"),
-        "dsn": d.get("dsn"),
-        "auth": d.get("auth"),
-        "trusted_connection": d.get("trusted_connection"),
-        "params": params if isinstance(params, dict) else (d.get("options") if isinstance(d.get("options"), dict) else None),
+        "server": _first(d, _SERVER_KEYS),
+        "db_name": _first(d, _DB_KEYS),
+        "username": _first(d, _USER_KEYS),
+        "password": _first(d, _PASSWORD_KEYS),
+        "driver": _first(d, _DRIVER_KEYS),
+        "dsn": get("dsn"),
+        "auth": get("auth"),
+        "trusted_connection": get("trusted_connection"),
+        "params": params,
     }
-    return {k: v for k, v in norm.items() if v not in (None, "")}
+    return {k: v for k, v in norm.items() if v is not None and v != ""}
 
 def _parse_params_qs(qs: Optional[str]) -> Dict[str, str]:
     """ODBC-Querystring (k=v&...) -> Dict."""
-    out: Dict[str, str] = {}
     if not qs:
-        return out
-    for piece in str(qs).split("&"):
+        return {}
+    # Diagnose-Attempts wiederholen dieselben Param-Strings -> Parse gecacht
+    return dict(_parse_params_qs_cached(str(qs)))
+
+@lru_cache(maxsize=256)
+def _parse_params_qs_cached(qs: str) -> Tuple[Tuple[str, str], ...]:
+    # parse_qsl (C-beschleunigt) nur, wenn nichts zu (ent)kodieren/trimmen ist:
+    # ODBC-Params sind roh (kein URL-Encoding) – '%'/'+' und Leerraum bleiben wörtlich
+    if not _QS_SLOW_CHARS.intersection(qs):
+        return tuple(dict(parse_qsl(qs, keep_blank_values=True)).items())
+    out: Dict[str, str] = {}
+    for piece in qs.split("&"):
         piece = piece.strip()
         if not piece:
             continue
-        if "=" in piece:
-            k, v = piece.split("=", 1)
-        else:
-            k, v = piece, ""
+        k, _, v = piece.partition("=")
         out[k] = v
-    return out
+    return tuple(out.items())
 
 def _extract_from_attempt(att: Dict[str, Any]) -> Dict[str, Any]:
     params = att.get("params")
@@ -306,13 +496,22 @@ def _extract_from_attempt(att: Dict[str, Any]) -> Dict[str, Any]:
         "trusted_connection": att.get("trusted_connection"),
         "params": params if isinstance(params, dict) else None,
     }
-    return {k: v for k, v in candidates.items() if v not in (None, "")}
+    return {k: v for k, v in candidates.items() if v is not None and v != ""}
 
 def _merge_preferring_left(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Werte aus a gewinnen; b füllt nur fehlende oder leere (None/"") Keys auf.
+    Reihenfolge: Keys von a, danach neue Keys aus b.
+
+    >>> _merge_preferring_left({"server": "a", "db_name": ""}, {"server": "b", "db_name": "x", "dsn": "d"})
+    {'server': 'a', 'db_name': 'x', 'dsn': 'd'}
+    >>> _merge_preferring_left({"trusted_connection": False}, {"trusted_connection": True})
+    {'trusted_connection': False}
+    """
     out = dict(a)
-    for k, v in b.items():
-        if k not in out or out[k] in (None, ""):
-            out[k] = v
+    out_get = out.get
+    # Filter in einem Durchlauf, danach ein einziges C-seitiges dict-Update (|=)
+    out |= {k: v for k, v in b.items() if (cur := out_get(k)) is None or cur == ""}
     return out
 
 def _infer_auth_from_flags(d: Dict[str, Any]) -> Optional[str]:
@@ -328,45 +527,38 @@ def build_config_candidate(settings, diag: Dict[str, Any]) -> Dict[str, Any]:
     Gibt **keine** echten Passwörter aus – Platzhalter wenn nötig.
     """
     base = _normalize_settings_dict(settings)
-    best = None
-    for att in diag.get("attempts", []):
-        if att.get("ok"):
-            best = att
-            break
-    from_attempt = _extract_from_attempt(best or {}) if best else {}
+    best = next((att for att in diag.get("attempts", ()) if att.get("ok")), None)
+    from_attempt = _extract_from_attempt(best) if best else {}
     merged = _merge_preferring_left(from_attempt, base)
 
+    auth = merged.get("auth")
+    if not auth:
+        auth = _infer_auth_from_flags(merged) or auth
+    auth_l = _auth_lower(auth)
+    needs_password = auth_l in _PASSWORD_AUTHS and not merged.get("trusted_connection", False)
+
+    # Direkt in Zielreihenfolge (_ORDERED_KEYS) aufbauen – kein Umsortieren,
+    # keine Key-Vergleiche je Schleifendurchlauf
     config_entry: Dict[str, Any] = {}
-    # DSN bevorzugen, falls vorhanden
-    if merged.get("dsn"):
+    if merged.get("dsn"):  # DSN nur, wenn gesetzt
         config_entry["dsn"] = merged["dsn"]
-
-    for key in ("driver", "server", "db_name", "username", "auth", "trusted_connection"):
+    for key in _PLAIN_KEYS_BEFORE_PASSWORD:
         if key in merged:
             config_entry[key] = merged[key]
-
-    if isinstance(merged.get("params"), dict) and merged["params"]:
-        config_entry["params"] = merged["params"]
-
-    if "auth" not in config_entry or not config_entry["auth"]:
-        inferred = _infer_auth_from_flags(merged)
-        if inferred:
-            config_entry["auth"] = inferred
-
-    auth = str(config_entry.get("auth") or "").lower()
-    needs_password = auth in ("sql", "aad-password", "aad-sp")
-    if needs_password and not config_entry.get("trusted_connection", False):
-        config_entry["password"] = "<<<SET_SECRET_HERE>>>"
-
-    ordered_keys: List[str] = [
-        "dsn", "driver", "server", "db_name", "username", "password",
-        "auth", "trusted_connection", "params",
-    ]
-    return {k: config_entry[k] for k in ordered_keys if k in config_entry}
+    if needs_password:
+        config_entry["password"] = _PASSWORD_PLACEHOLDER
+    if auth or "auth" in merged:
+        config_entry["auth"] = auth
+    if "trusted_connection" in merged:
+        config_entry["trusted_connection"] = merged["trusted_connection"]
+    params = merged.get("params")
+    if isinstance(params, dict) and params:
+        config_entry["params"] = params
+    return config_entry
 
 def render_config_json(node: str, entry: Dict[str, Any]) -> str:
     payload = {"sql": {node: entry}}
-    return json.dumps(payload, ensure_ascii=False, indent=2)
+    return _dumps(payload)
 
 # =====================================
 #   Config schreiben (atomar)
@@ -375,106 +567,323 @@ def render_config_json(node: str, entry: Dict[str, Any]) -> str:
 class ConfigUpdateError(RuntimeError):
     """Fehler beim Lesen/Schreiben/Mergen der config.json."""
 
-def _load_json_file(path: str) -> Dict[str, Any]:
-    if not os.path.exists(path):
-        return {}
+def _load_json_file(path: str) -> Tuple[Dict[str, Any], Optional[bytes]]:
+    """
+    (geparstes JSON, Rohbytes) der Datei; fehlende Datei -> ({}, None).
+    Die Rohbytes dienen Vorbedingungs-Hash und No-op-Erkennung ohne zweites Lesen.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as ex:
+        return _read_json_cached_raw(path)
+    except FileNotFoundError:
+        return {}, None
+    except ValueError as ex:  # json/orjson.JSONDecodeError bzw. ujson: alle ValueError
         raise ConfigUpdateError(f"config.json ist kein gültiges JSON: {path} ({ex})") from ex
     except OSError as ex:
         raise ConfigUpdateError(f"config.json konnte nicht gelesen werden: {path} ({ex})") from ex
 
-def _save_json_atomic(path: str, data: Dict[str, Any]) -> None:
+def _dump_json_bytes(data: Any, *, trailing_newline: bool = True) -> bytes:
+    """JSON (indent=2, UTF-8, optional abschließender Zeilenumbruch) als bytes."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_APPEND_NEWLINE if trailing_newline else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass  # z. B. Nicht-String-Keys -> stdlib json
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    return (text + "\n" if trailing_newline else text).encode("utf-8")
+
+def _save_json_atomic(path: str, data: Dict[str, Any], *, payload: Optional[bytes] = None) -> None:
+    """
+    Atomarer Schreibvorgang über graphfw.io.writers._atomic (Temp-Datei im
+    Zielordner, fsync, os.replace, fsync des Ordners). Eine neu angelegte
+    config.json erhält 0600, eine bestehende behält ihre Rechte.
+    payload: bereits serialisierte Bytes von data (vermeidet doppeltes Dumpen).
+    """
+    # lazy: graphfw.io.writers importiert beim Laden pandas/SQLAlchemy
+    from graphfw.io.writers._atomic import _atomic_write
+
+    if payload is None:
+        payload = _dump_json_bytes(data)
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    fd, tmp_path = tempfile.mkstemp(prefix=".config.json.", suffix=".tmp", dir=os.path.dirname(path) or ".")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            f.write("\n")
-        os.replace(tmp_path, path)
+        _atomic_write(Path(path), lambda tmp: tmp.write_bytes(payload), new_mode=0o600)
     except OSError as ex:
-        try:
-            os.remove(tmp_path)
-        except OSError:
-            pass
         raise ConfigUpdateError(f"config.json konnte nicht geschrieben werden: {path} ({ex})") from ex
+    _invalidate_config_cache(path)
 
-def _mask_password(v: Any) -> Any:
-    if isinstance(v, str) and v:
-        return "******"
-    return v
+# Felder, die _validate_entry liest
+_VALIDATED_KEYS = frozenset({"dsn", "driver", "server", "db_name", "auth", "password"})
+
+# (Sekunde, formatierter Sekundenanteil); als Tupel atomar ersetzt (thread-sicher)
+_TS_CACHE: Tuple[int, str] = (-1, "")
+
+def _backup_timestamp() -> str:
+    """
+    YYYYmmddHHMMSS-ffffff (lokale Zeit). Der Mikrosekunden-Suffix hält Backups
+    mehrerer Updates je Sekunde getrennt; strftime läuft nur einmal je Sekunde.
+    """
+    global _TS_CACHE
+    sec, frac = divmod(time.time_ns(), 1_000_000_000)
+    cached = _TS_CACHE
+    if cached[0] != sec:
+        cached = _TS_CACHE = (sec, time.strftime("%Y%m%d%H%M%S", time.localtime(sec)))
+    return f"{cached[1]}-{frac // 1000:06d}"
+
+_JOURNAL_NAME = ".config.journal.jsonl"
+
+def _append_journal(config_abs_path: str, record: Dict[str, Any]) -> str:
+    """
+    Hängt 'record' als JSON-Zeile an das Journal neben config.json an
+    (O_APPEND: eine Zeile je write, auch bei parallelen Schreibern).
+    Gibt den Journal-Pfad zurück; Schreibfehler werden als OSError geworfen.
+    """
+    path = os.path.join(os.path.dirname(config_abs_path), _JOURNAL_NAME)
+    if orjson is not None:
+        line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    else:  # pragma: no cover
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    try:
+        os.write(fd, line)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return path
+
+# Prüf-Ergebnis je Merkmals-Tupel (s. _validate_entry); höchstens 2**6 Einträge
+_VALIDATE_CACHE: Dict[Tuple[bool, ...], Optional[str]] = {}
 
 def _validate_entry(entry: Dict[str, Any]) -> None:
-    if not entry.get("dsn"):
-        need = [k for k in ("driver", "server", "db_name") if not entry.get(k)]
+    get = entry.get
+    # Schlüssel deckt genau die Merkmale ab, die die Prüfung liest
+    key = (
+        bool(get("dsn")), bool(get("driver")), bool(get("server")), bool(get("db_name")),
+        _auth_lower(get("auth")) in _PASSWORD_AUTHS, get("password", None) == "",
+    )
+    try:
+        msg = _VALIDATE_CACHE[key]
+    except KeyError:
+        msg = _VALIDATE_CACHE[key] = _validation_error(*key)
+    if msg is not None:
+        raise ConfigUpdateError(msg)
+
+def _validation_error(has_dsn: bool, has_driver: bool, has_server: bool, has_db: bool,
+                      password_auth: bool, empty_password: bool) -> Optional[str]:
+    if not has_dsn:
+        need = [k for k, ok in (("driver", has_driver), ("server", has_server), ("db_name", has_db)) if not ok]
         if need:
-            raise ConfigUpdateError(f"Ungültiger SQL-Eintrag: fehlende Felder {need}. "
-                                    f"Erforderlich: DSN ODER (driver, server, db_name).")
-    auth = str(entry.get("auth") or "").lower()
-    if auth in ("sql", "aad-password", "aad-sp"):
-        if entry.get("password", None) == "":
-            raise ConfigUpdateError("Password ist leerer String. Entfernen oder Platzhalter/Secret verwenden.")
+            return (f"Ungültiger SQL-Eintrag: fehlende Felder {need}. "
+                    f"Erforderlich: DSN ODER (driver, server, db_name).")
+    if password_auth and empty_password:
+        return "Password ist leerer String. Entfernen oder Platzhalter/Secret verwenden."
+    return None
 
-def apply_config_update(
-    *,
-    config_path: str,
+def _mask_secret(value: Any) -> Any:
+    return _MASK if isinstance(value, str) and value else value
+
+def _mask_dict(entry: Dict[str, Any], *, mask_params: bool = False) -> Dict[str, Any]:
+    """
+    Kopie von entry mit maskiertem password; mask_params=True maskiert zusätzlich
+    die Werte in params (können Secrets enthalten, z. B. für das Journal).
+    """
+    out = dict(entry)
+    if "password" in out:
+        out["password"] = _mask_secret(out["password"])
+    if mask_params and "params" in out:
+        params = out["params"]
+        if isinstance(params, dict):
+            out["params"] = {k: _mask_secret(v) for k, v in params.items()}
+        else:
+            out["params"] = _mask_secret(params)
+    return out
+
+def _merge_one(
+    sql: Dict[str, Any],
     node: str,
     new_entry: Dict[str, Any],
-    create_backup: bool = True,
-    keep_existing_password: bool = True,
-    dry_run: bool = False,
-) -> Dict[str, Any]:
+    keep_existing_password: bool,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
-    Schreibt/merged den SQL-Block in die echte config.json.
+    Merged new_entry in sql[node] (in-place) und gibt (prev, merged_entry) zurück.
+    new_entry muss bereits validiert sein.
     """
-    _validate_entry(new_entry)
-    root = _load_json_file(config_path)
-    if not isinstance(root, dict):
-        raise ConfigUpdateError("Die Wurzel der config.json ist kein Objekt (Dict).")
-    sql = root.get("sql")
-    if not isinstance(sql, dict):
-        sql = {}
-        root["sql"] = sql
-
     prev: Dict[str, Any] = {}
     if node in sql and isinstance(sql[node], dict):
         prev = dict(sql[node])
 
-    placeholder = "<<<SET_SECRET_HERE>>>"
     prev_password = prev.get("password")
     new_password = new_entry.get("password")
-    merged_entry = dict(prev)
-    merged_entry.update(new_entry)
+    merged_entry = {**prev, **new_entry}
+    # Prüfungsrelevante Felder nur aus prev geerbt oder per Passwort-Logik
+    # verändert? Sonst gleicht die Prüfung der von new_entry -> überspringen.
+    schema_dirty = not _VALIDATED_KEYS.isdisjoint(prev.keys() - new_entry.keys())
 
     if keep_existing_password:
-        if (new_password is None) or (isinstance(new_password, str) and new_password.strip() == placeholder):
+        if new_password is None or (isinstance(new_password, str) and new_password.strip() == _PASSWORD_PLACEHOLDER):
             if prev_password:
                 merged_entry["password"] = prev_password
+                schema_dirty = True
             else:
-                if str(merged_entry.get("auth", "")).lower() in ("trusted", "aad-integrated", "aad-interactive", "aad-msi"):
-                    merged_entry.pop("password", None)
+                if _auth_lower(merged_entry.get("auth")) in _PASSWORDLESS_AUTHS:
+                    if merged_entry.pop("password", None) is not None:
+                        schema_dirty = True
 
-    _validate_entry(merged_entry)
-
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    backup_path = None
-    if not dry_run and create_backup and os.path.exists(config_path):
-        backup_path = f"{config_path}.bak-{timestamp}"
-        shutil.copy2(config_path, backup_path)
+    if schema_dirty:
+        _validate_entry(merged_entry)
 
     sql[node] = merged_entry
-    if not dry_run:
-        _save_json_atomic(config_path, root)
-
-    info = {
-        "path": os.path.abspath(config_path),
-        "backup_path": os.path.abspath(backup_path) if backup_path else None,
-        "previous_entry_masked": {k: (_mask_password(v) if k == "password" else v) for k, v in prev.items()},
-        "result_entry_masked": {k: (_mask_password(v) if k == "password" else v) for k, v in merged_entry.items()},
-        "written": not dry_run,
+    return prev, merged_entry
+
+def apply_config_updates(
+    *,
+    config_path: str,
+    updates: List[Tuple[str, Dict[str, Any]]],
+    create_backup: bool = True,
+    keep_existing_password: bool = True,
+    dry_run: bool = False,
+    expected_prev_sha256: Optional[str] = None,
+    journal: bool = False,
+) -> Dict[str, Any]:
+    """
+    Wie apply_config_update, aber für mehrere (node, new_entry)-Paare:
+    config.json wird einmal gelesen, alle Merges im Speicher angewendet und
+    einmal geschrieben (ein fsync, höchstens ein Backup und eine Journal-Zeile).
+    Ist ein Eintrag ungültig, wird nichts geschrieben.
+
+    Rückgabe wie apply_config_update, statt der Einzel-Einträge jedoch
+    "changes": [{"node", "previous_entry_masked", "result_entry_masked"}, ...].
+    """
+    abs_path = os.path.abspath(config_path)
+    for _, new_entry in updates:
+        _validate_entry(new_entry)
+    # ein Lesevorgang für Inhalt UND Hash (kein Zeitfenster zwischen beiden)
+    root, prev_raw = _load_json_file(config_path)
+    prev_digest = hashlib.sha256(prev_raw).digest() if prev_raw is not None else None
+    if expected_prev_sha256 is not None:
+        current_hex = prev_digest.hex() if prev_digest is not None else None
+        if current_hex != expected_prev_sha256.strip().lower():
+            raise ConfigUpdateError(
+                f"stale_precondition: config.json wurde zwischenzeitlich geändert "
+                f"(erwartet {expected_prev_sha256}, aktuell {current_hex or 'nicht vorhanden'})."
+            )
+    if not isinstance(root, dict):
+        raise ConfigUpdateError("Die Wurzel der config.json ist kein Objekt (Dict).")
+    sql = root.get("sql")
+    modified = not isinstance(sql, dict)
+    if modified:
+        sql = {}
+        root["sql"] = sql
+
+    changes: List[Dict[str, Any]] = []
+    merged: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = []
+    for node, new_entry in updates:
+        prev, merged_entry = _merge_one(sql, node, new_entry, keep_existing_password)
+        modified = modified or merged_entry != prev
+        merged.append((node, prev, merged_entry))
+        changes.append({
+            "node": node,
+            "previous_entry_masked": _mask_dict(prev),
+            "result_entry_masked": _mask_dict(merged_entry),
+        })
+
+    if not modified and prev_digest is not None:
+        # Idempotentes Update (Soll == Ist): weder serialisieren noch Backup/Schreiben
+        payload = None
+        new_digest = prev_digest
+        unchanged = True
+    else:
+        payload = _dump_json_bytes(root)
+        # Inhalt identisch zur bestehenden Datei -> weder Backup noch Schreiben
+        new_digest = hashlib.sha256(payload).digest()
+        unchanged = prev_digest == new_digest
+
+    backup_path = None
+    journal_path = None
+    journal_error = None
+    if not dry_run and not unchanged:
+        if create_backup and prev_digest is not None:
+            backup_path = f"{abs_path}.bak-{_backup_timestamp()}"
+            # Hardlink statt Kopie: _save_json_atomic ersetzt per os.replace durch eine
+            # neue Datei (neuer Inode) -> das Backup zeigt weiter auf den alten Inhalt.
+            try:
+                os.link(config_path, backup_path)
+            except OSError:  # z. B. anderes Device, FAT, keine Rechte
+                import shutil  # lazy: nur für diesen Fallback
+                # nur Inhalt (Linux: sendfile/copy_file_range); Metadaten braucht das Backup nicht
+                shutil.copyfile(config_path, backup_path)
+        _save_json_atomic(config_path, root, payload=payload)
+        if journal:
+            record = {
+                "ts": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "path": abs_path,
+                "nodes": [node for node, _, _ in merged],
+                "prev_sha256": prev_digest.hex() if prev_digest is not None else None,
+                "new_sha256": new_digest.hex(),
+                "changes": [
+                    {
+                        "node": node,
+                        "previous_entry_masked": _mask_dict(prev, mask_params=True),
+                        "result_entry_masked": _mask_dict(merged_entry, mask_params=True),
+                    }
+                    for node, prev, merged_entry in merged
+                ],
+            }
+            # config.json ist bereits geschrieben -> Journal-Fehler melden, nicht werfen
+            try:
+                journal_path = _append_journal(abs_path, record)
+            except OSError as ex:
+                journal_error = f"Journal konnte nicht geschrieben werden: {ex}"
+
+    return {
+        "path": abs_path,
+        "backup_path": backup_path,
+        "journal_path": journal_path,
+        "journal_error": journal_error,
+        "changes": changes,
+        "written": not dry_run and not unchanged,
+        "unchanged": unchanged,
+        "prev_sha256": prev_digest.hex() if prev_digest is not None else None,
+        "new_sha256": new_digest.hex(),
     }
+
+def apply_config_update(
+    *,
+    config_path: str,
+    node: str,
+    new_entry: Dict[str, Any],
+    create_backup: bool = True,
+    keep_existing_password: bool = True,
+    dry_run: bool = False,
+    expected_prev_sha256: Optional[str] = None,
+    journal: bool = False,
+) -> Dict[str, Any]:
+    """
+    Schreibt/merged den SQL-Block in die echte config.json.
+
+    create_backup: vor jedem tatsächlichen Schreibvorgang `<config>.bak-<timestamp>`
+    anlegen (Hardlink, Fallback Inhaltskopie).
+    journal: zusätzlich eine Zeile an das Journal `.config.journal.jsonl` (im
+    Ordner der config.json) anhängen – Zeitstempel, Node, SHA-256 vorher/nachher
+    und maskierte Einträge (password und params-Werte). Schlägt das Journal fehl,
+    steht der Grund in info["journal_error"]; das Update bleibt geschrieben.
+
+    expected_prev_sha256: optionale Vorbedingung (Hex-SHA-256 der Datei, wie sie
+    der Aufrufer gelesen hat, z. B. aus info["prev_sha256"] eines vorherigen
+    Aufrufs). Weicht der aktuelle Stand ab, wird ConfigUpdateError geworfen
+    statt fremde Änderungen zu überschreiben (Optimistic Concurrency).
+    """
+    info = apply_config_updates(
+        config_path=config_path,
+        updates=[(node, new_entry)],
+        create_backup=create_backup,
+        keep_existing_password=keep_existing_password,
+        dry_run=dry_run,
+        expected_prev_sha256=expected_prev_sha256,
+        journal=journal,
+    )
+    change = info.pop("changes")[0]
+    info["previous_entry_masked"] = change["previous_entry_masked"]
+    info["result_entry_masked"] = change["result_entry_masked"]
     return info
 
 # =====================================
@@ -491,57 +900,190 @@ def connect_and_check(
     config_path: str = CONFIG_PATH,
     keep_existing_password: bool = True,
     dry_run: bool = False,
+    verbose: bool = True,
 ) -> Tuple[bool, Dict[str, Any], Optional[str], Optional[Dict[str, Any]]]:
     """
     Lädt SQL-Settings, führt Diagnose (core.odbc_utils) durch und erzeugt/optional schreibt einen config.json-Block.
+    verbose=False unterdrückt sämtliche Ausgaben (z. B. für Automatisierung/CI).
+    """
+    return _connect_and_check_one(
+        node,
+        show_drivers=show_drivers,
+        show_dsns=show_dsns,
+        return_config_json=return_config_json,
+        write_config=write_config,
+        config_path=config_path,
+        keep_existing_password=keep_existing_password,
+        dry_run=dry_run,
+        verbose=verbose,
+    )
+
+def connect_and_check_many(
+    nodes: List[str],
+    *,
+    show_drivers: bool = True,
+    show_dsns: bool = True,
+    return_config_json: bool = True,
+    write_config: bool = False,
+    config_path: str = CONFIG_PATH,
+    keep_existing_password: bool = True,
+    dry_run: bool = False,
+    diag_ttl_s: float = 300.0,
+    verbose: bool = True,
+) -> Dict[str, Tuple[bool, Dict[str, Any], Optional[str], Optional[Dict[str, Any]]]]:
     """
-    print(f"\n=== Node: {node} ===")
-    if show_drivers:
-        print("ODBC-Treiber (SQL Server):", list_odbc_drivers())
-    if show_dsns:
-        print("ODBC-DSNs:", list_odbc_data_sources())
+    Wie connect_and_check, aber für mehrere Nodes in einem Lauf.
 
-    settings, info = load_sql_settings(config_path=config_path, node=node, env_override=True)
-    print("Quelle:", info.get("source"), "| Node:", info.get("node_path"))
-    print("Settings:", settings.as_dict(mask_secrets=True))
+    - Treiber/DSNs werden nur einmal ausgegeben.
+    - Nodes mit identischen Verbindungsparametern (server, db_name, driver, dsn,
+      auth, username, Passwort-Hash, params) teilen sich eine Diagnose, solange
+      sie jünger als `diag_ttl_s` Sekunden ist (0 -> kein Teilen).
+    - config.json wird über den Parse-Cache nur einmal gelesen.
 
-    ok, diag = diagnose_with_fallbacks(settings)
-    print(diag.get("summary", ""))
-    for i, att in enumerate(diag.get("attempts", []), 1):
-        status = "OK" if (att.get("ok") or ("error" not in att)) else "ERR"
-        print(
-            f"  [{i:02d}] {att.get('method','?'):<18} | driver={att.get('driver') or att.get('provider') or '-'} "
-            f"| params={att.get('params') or att.get('conn_str_masked') or ''} | {att.get('duration_s','-')}s"
-        )
-        if att.get("error"):
-            print("       ", att["error"])
-    if diag.get("suggestions"):
-        print("\nHinweise:")
-        for s in diag["suggestions"]:
-            print(" -", s)
-
-    config_json: Optional[str] = None
-    candidate_entry: Optional[Dict[str, Any]] = None
-    if return_config_json or write_config:
-        candidate_entry = build_config_candidate(settings, diag)
-        if return_config_json:
-            config_json = render_config_json(node, candidate_entry)
-            print("\nVorschlag für config.json (einfügbar):\n")
-            print(config_json)
-            print("\nHinweis: Passwort ist als Platzhalter gesetzt. Bitte sicher hinterlegen (Secret/ENV).")
-
-    write_info: Optional[Dict[str, Any]] = None
-    if write_config and candidate_entry is not None:
-        print(f"\nSchreibe Update nach {os.path.abspath(config_path)} (dry_run={dry_run}) …")
-        write_info = apply_config_update(
+    Rückgabe: {node: (ok, diag, config_json, write_info)} in Eingabereihenfolge.
+    """
+    diag_cache: Dict[Tuple[Any, ...], Tuple[float, Tuple[bool, Dict[str, Any]]]] = {}
+    results: Dict[str, Tuple[bool, Dict[str, Any], Optional[str], Optional[Dict[str, Any]]]] = {}
+    for i, node in enumerate(nodes):
+        results[node] = _connect_and_check_one(
+            node,
+            show_drivers=show_drivers and i == 0,
+            show_dsns=show_dsns and i == 0,
+            return_config_json=return_config_json,
+            write_config=write_config,
             config_path=config_path,
-            node=node,
-            new_entry=candidate_entry,
-            create_backup=True,
             keep_existing_password=keep_existing_password,
             dry_run=dry_run,
+            diag_cache=diag_cache,
+            diag_ttl_s=diag_ttl_s,
+            verbose=verbose,
         )
-        print("Update:", {k: write_info[k] for k in ("path", "backup_path", "written")})
-        print("Ergebnis (maskiert):", write_info.get("result_entry_masked"))
+    return results
+
+def _diag_cache_key(settings) -> Tuple[Any, ...]:
+    """Schlüssel für geteilte Diagnosen; Passwort nur als SHA-256."""
+    n = _normalize_settings_dict(settings)
+    pw = n.get("password")
+    pw_hash = hashlib.sha256(str(pw).encode("utf-8")).hexdigest() if pw else None
+    params = n.get("params") or {}
+    params_key = tuple(sorted((str(k), str(v)) for k, v in params.items()))
+    return (
+        n.get("server"), n.get("db_name"), n.get("driver"), n.get("dsn"),
+        _auth_lower(n.get("auth")), n.get("trusted_connection"), n.get("username"),
+        pw_hash, params_key,
+    )
 
-    return ok, diag, config_json, write_info
+def _diagnose(
+    settings,
+    diag_cache: Optional[Dict[Tuple[Any, ...], Tuple[float, Tuple[bool, Dict[str, Any]]]]],
+    diag_ttl_s: float,
+) -> Tuple[bool, Dict[str, Any]]:
+    """diagnose_with_fallbacks, optional über einen (batch-lokalen) TTL-Cache."""
+    if diag_cache is None or diag_ttl_s <= 0:
+        return diagnose_with_fallbacks(settings)
+    key = _diag_cache_key(settings)
+    now = time.monotonic()
+    hit = diag_cache.get(key)
+    if hit is not None and now - hit[0] <= diag_ttl_s:
+        ok, diag = hit[1]
+        return ok, copy.deepcopy(diag)
+    ok, diag = diagnose_with_fallbacks(settings)
+    diag_cache[key] = (now, (ok, copy.deepcopy(diag)))
+    return ok, diag
+
+@lru_cache(maxsize=512)
+def _fmt_attempt(i: int, method: str, driver: str, params: str, duration: Any) -> str:
+    """Formatierte Versuchszeile; bei vielen Nodes wiederholen sich die Zeilen."""
+    return f"  [{i:02d}] {method:<18} | driver={driver} | params={params} | {duration}s"
+
+def _flush_output(buf: io.StringIO) -> None:
+    text = buf.getvalue()
+    if text:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        buf.seek(0)
+        buf.truncate()
+
+def _connect_and_check_one(
+    node: str,
+    *,
+    show_drivers: bool,
+    show_dsns: bool,
+    return_config_json: bool,
+    write_config: bool,
+    config_path: str,
+    keep_existing_password: bool,
+    dry_run: bool,
+    diag_cache: Optional[Dict[Tuple[Any, ...], Tuple[float, Tuple[bool, Dict[str, Any]]]]] = None,
+    diag_ttl_s: float = 0.0,
+    verbose: bool = True,
+) -> Tuple[bool, Dict[str, Any], Optional[str], Optional[Dict[str, Any]]]:
+    # Ausgaben sammeln und blockweise mit einem write() ausgeben statt je print()
+    buf = io.StringIO()
+    emit = partial(print, file=buf)
+    try:
+        if verbose:
+            emit(f"\n=== Node: {node} ===")
+            if show_drivers:
+                emit("ODBC-Treiber (SQL Server):", _cached_odbc_listing("drivers", list_odbc_drivers))
+            if show_dsns:
+                emit("ODBC-DSNs:", _cached_odbc_listing("dsns", list_odbc_data_sources))
+
+        settings, info = load_sql_settings(config_path=config_path, node=node, env_override=True)
+        if verbose:
+            emit("Quelle:", info.get("source"), "| Node:", info.get("node_path"))
+            emit("Settings:", settings.as_dict(mask_secrets=True))
+
+        # vor der (langsamen) Diagnose ausgeben, damit der Fortschritt sichtbar ist
+        _flush_output(buf)
+        ok, diag = _diagnose(settings, diag_cache, diag_ttl_s)
+        if verbose:
+            emit(diag.get("summary", ""))
+            attempts = diag.get("attempts") or []
+            for i, att in enumerate(attempts, 1):
+                get = att.get
+                method = get("method", "?")
+                drv = get("driver") or get("provider") or "-"
+                params_s = get("params") or get("conn_str_masked") or ""
+                if not isinstance(params_s, str):
+                    params_s = str(params_s)  # dict o. Ä. nicht hashbar -> Textform für den Cache
+                emit(_fmt_attempt(i, method, drv, params_s, get("duration_s", "-")))
+                err = get("error")
+                if err:
+                    emit("       ", err)
+            if diag.get("suggestions"):
+                emit("\nHinweise:")
+                for s in diag["suggestions"]:
+                    emit(" -", s)
+
+        config_json: Optional[str] = None
+        candidate_entry: Optional[Dict[str, Any]] = None
+        if return_config_json or write_config:
+            candidate_entry = build_config_candidate(settings, diag)
+            # Rendern nur, wenn der JSON-Text auch zurückgegeben wird
+            if return_config_json:
+                config_json = render_config_json(node, candidate_entry)
+                if verbose:
+                    emit("\nVorschlag für config.json (einfügbar):\n")
+                    emit(config_json)
+                    emit("\nHinweis: Passwort ist als Platzhalter gesetzt. Bitte sicher hinterlegen (Secret/ENV).")
+
+        write_info: Optional[Dict[str, Any]] = None
+        if write_config and candidate_entry is not None:
+            write_info = apply_config_update(
+                config_path=config_path,
+                node=node,
+                new_entry=candidate_entry,
+                create_backup=True,
+                keep_existing_password=keep_existing_password,
+                dry_run=dry_run,
+            )
+            if verbose:
+                # absoluter Pfad kommt aus apply_config_update (kein zweites abspath)
+                emit(f"\nUpdate für {write_info['path']} (dry_run={dry_run}) …")
+                emit("Update:", {k: write_info[k] for k in ("path", "journal_path", "backup_path", "written", "unchanged")})
+                emit("Ergebnis (maskiert):", write_info.get("result_entry_masked"))
+
+        return ok, diag, config_json, write_info
+    finally:
+        _flush_output(buf)